@@ -73,6 +73,7 @@ class FloatConfig:
             'ollama_model': 'llama3.1:8b',
             'chunk_size': 2000,
             'chunk_overlap': 200,
+            'search_cache_ttl': 300,  # seconds floatctl query reuses identical results, 0 disables
             'log_level': 'INFO',
             'log_dir': None,   # Will default to dropzone/.logs/
             'log_file': None,  # Will default to log_dir/float_daemon.log
@@ -231,9 +231,9 @@ class ConversationDisEnhanced:
         questions = self.patterns['questions'].findall(content)
         analysis['questions_asked'] = [q.strip() for q in questions if len(q.strip()) > 5]
         
-        # File references
+        # File references (deduplicated in first-seen order so .dis output is stable)
         file_refs = self.patterns['file_references'].findall(content)
-        analysis['file_references'] = list(set(file_refs))
+        analysis['file_references'] = list(dict.fromkeys(file_refs))
         
         # URL analysis
         urls = self.patterns['conversation_urls'].findall(content)
@@ -241,7 +241,7 @@ class ConversationDisEnhanced:
         
         # Timestamp extraction
         timestamps = self.patterns['timestamp_patterns'].findall(content)
-        analysis['timestamps'] = list(set(timestamps))
+        analysis['timestamps'] = list(dict.fromkeys(timestamps))
         
         return analysis
     
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the FLOAT .dis generator
+Generates a .dis document from sample metadata and prints it
+"""
+
+from float_dis_template_system import FloatDisGenerator
+
+
+def main():
+    print("FLOAT .dis generator smoke test")
+
+    # Sample data for testing
+    sample_file_metadata = {
+        'filename': 'test.json',
+        'extension': '.json',
+        'size_bytes': 1024,
+        'file_type': 'JSON file',
+        'created_at': '2025-06-09T12:00:00',
+        'modified_at': '2025-06-09T12:00:00'
+    }
+
+    sample_chroma_metadata = {
+        'collection_name': 'test_collection',
+        'chunk_count': 1,
+        'chunk_ids': ['test_chunk_1']
+    }
+
+    sample_content_analysis = {
+        'summary': 'Test file',
+        'word_count': 100,
+        'has_ctx_markers': True,
+        'ctx_count': 5
+    }
+
+    generator = FloatDisGenerator()
+    result = generator.generate_float_dis(
+        sample_file_metadata, 
+        sample_chroma_metadata, 
+        sample_content_analysis, 
+        'test_float_id'
+    )
+
+    print("✅ Generated sample .dis content successfully")
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
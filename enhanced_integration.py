@@ -11,6 +11,8 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any
 from urllib.parse import urlparse
 
+from storage_utils import JSON_START_RE, add_chunks
+
 try:
     import frontmatter
     FRONTMATTER_AVAILABLE = True
@@ -18,6 +20,22 @@ except ImportError:
     FRONTMATTER_AVAILABLE = False
     frontmatter = None
 
+# Case-insensitive content cues, searched on the original text so no lowercased copy is made
+_DAILY_LOG_MARKER_RE = re.compile('|'.join(re.escape(marker) for marker in (
+    'type: log',
+    'daily log',
+    '## brain boot',
+    '## body boot',
+    '## daily tasks',
+    '## today\'s focus',
+    '<< [[float.logs/',
+    '>> [[float.logs/'
+)), re.IGNORECASE)
+_CONVERSATION_CUE_RE = re.compile(r'conversation|chat', re.IGNORECASE)
+_RESEARCH_CUE_RE = re.compile(r'research|analysis', re.IGNORECASE)
+_MEETING_CUE_RE = re.compile(r'meeting|notes', re.IGNORECASE)
+
+
 class EnhancedSystemIntegration:
     """Enhanced integration between daemon and daily context systems"""
     
@@ -603,19 +621,7 @@ class EnhancedSystemIntegration:
             return True
         
         # Priority 3: Check content markers
-        content_lower = content.lower()
-        daily_log_markers = [
-            'type: log',
-            'daily log',
-            '## brain boot',
-            '## body boot',
-            '## daily tasks',
-            '## today\'s focus',
-            '<< [[float.logs/',
-            '>> [[float.logs/'
-        ]
-        
-        if any(marker in content_lower for marker in daily_log_markers):
+        if _DAILY_LOG_MARKER_RE.search(content):
             return True
         
         # Priority 4: Check for daily log structure patterns
@@ -1035,7 +1041,6 @@ Respond in JSON format:
     
     def _classify_content_type(self, content: str, basic_analysis: Dict) -> str:
         """Classify content type for enhanced processing"""
-        content_lower = content.lower()
         metadata = basic_analysis.get('metadata', {})
         
         # Check if it's a daily log first using comprehensive detection
@@ -1049,18 +1054,18 @@ Respond in JSON format:
             return 'ai_conversation_chrome_export'
         elif '"powered_by": "ChatGPT Exporter' in content:
             return 'ai_conversation_chrome_export'
-        elif 'conversation' in content_lower or 'chat' in content_lower:
+        elif _CONVERSATION_CUE_RE.search(content):
             # Double-check it's not a daily log talking about conversations
             metadata = basic_analysis.get('metadata', {})
             if not self.is_daily_log(content, metadata):
                 return 'conversation'
-        elif content.strip().startswith('{') or content.strip().startswith('['):
+        elif JSON_START_RE.match(content):
             return 'structured_data'
         elif len([line for line in content.split('\n') if line.startswith('#')]) > 3:
             return 'markdown_document'
-        elif 'research' in content_lower or 'analysis' in content_lower:
+        elif _RESEARCH_CUE_RE.search(content):
             return 'research_document'
-        elif 'meeting' in content_lower or 'notes' in content_lower:
+        elif _MEETING_CUE_RE.search(content):
             return 'meeting_notes'
         else:
             return 'general_document'
@@ -1236,7 +1241,9 @@ Respond in JSON format:
                     # Chunk content for storage
                     chunks = self.daemon._chunk_content(content)
                     
-                    # Store with enhanced metadata
+                    # Store with enhanced metadata, all chunks in one batch
+                    chunk_ids = []
+                    chunk_metadatas = []
                     for i, chunk in enumerate(chunks):
                         chunk_id = f"{float_id}_{collection_type}_chunk_{i}"
                         
@@ -1261,11 +1268,10 @@ Respond in JSON format:
                             chunk_metadata, content, metadata, enhanced_analysis
                         )
                         
-                        collection.add(
-                            documents=[chunk],
-                            metadatas=[chunk_metadata],
-                            ids=[chunk_id]
-                        )
+                        chunk_ids.append(chunk_id)
+                        chunk_metadatas.append(chunk_metadata)
+                    
+                    add_chunks(collection, chunks, chunk_metadatas, chunk_ids)
                     
                     self.logger.info(f"Routed to {collection_name}: {len(chunks)} chunks",
                                    extra={'float_id': float_id, 'collection': collection_name})
@@ -1328,7 +1334,9 @@ Respond in JSON format:
                     # Chunk content for storage
                     chunks = self.daemon._chunk_content(content)
                     
-                    # Store with enhanced metadata
+                    # Store with enhanced metadata, all chunks in one batch
+                    chunk_ids = []
+                    chunk_metadatas = []
                     for i, chunk in enumerate(chunks):
                         chunk_id = f"{float_id}_{pattern_type}_chunk_{i}"
                         
@@ -1374,11 +1382,10 @@ Respond in JSON format:
                             chunk_metadata, content, metadata, enhanced_analysis
                         )
                         
-                        collection.add(
-                            documents=[chunk],
-                            metadatas=[chunk_metadata],
-                            ids=[chunk_id]
-                        )
+                        chunk_ids.append(chunk_id)
+                        chunk_metadatas.append(chunk_metadata)
+                    
+                    add_chunks(collection, chunks, chunk_metadatas, chunk_ids)
                     
                     self.logger.info(f"Routed to special pattern collection {collection_name}: {len(chunks)} chunks",
                                    extra={'float_id': float_id, 'collection': collection_name, 'pattern_type': pattern_type})
@@ -8,6 +8,10 @@ Issue #5: Now includes plugin architecture support for extensible pattern detect
 
 import re
 import json
+import operator
+from collections import Counter
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional, Set
 from pathlib import Path
 from datetime import datetime
@@ -18,6 +22,69 @@ from datetime import datetime
 PLUGIN_SYSTEM_AVAILABLE = False
 print("🔧 Plugin system temporarily removed for safety refactoring (issue #14) - using built-in patterns")
 
+# Platform patterns are scanned in a single fused pass. They match distinct literals
+# that never overlap, so one alternation reports the same counts as running each
+# pattern separately.
+PLATFORM_PATTERN_NAMES = ('lovable_refs', 'v0_refs', 'magic_patterns', 'github_refs', 'thought_buckets')
+# Persona annotations can nest ([lf1m:: outer [qtb:: inner]]), so each is counted on its own
+PERSONA_PATTERN_NAMES = ('any_combo', 'lf1m_notes', 'qtb_notes', 'karen_notes', 'sysop_notes', 'little_fucker')
+# BBS heritage patterns mapped to a lowercase literal every match contains
+BBS_PATTERN_LITERALS = {'float_dis': 'float', 'float_diis': 'float', 'file_id_diz': 'file_id'}
+
+# Shared read-only default for missing analysis sections (avoids a fresh {} per lookup)
+_EMPTY = MappingProxyType({})
+
+# Top-level sections read by PatternSignalSummary; every detector result carries them
+_summary_sections = operator.itemgetter(
+    'analysis_metadata', 'signal_analysis', 'persona_analysis', 'document_structure', 'bbs_heritage'
+)
+
+
+def _strip_closing_separator(text: str) -> str:
+    """Drop a closing '::' (and the whitespace before it) from an annotation body"""
+    stripped = text.rstrip()
+    if stripped.endswith('::'):
+        return stripped[:-2].rstrip()
+    return text
+
+
+@dataclass
+class PatternSignalSummary:
+    """Hot scalar fields of a pattern analysis, read once for priority/complexity checks."""
+    __slots__ = ('word_count', 'total_core_signals', 'has_high_signal_density',
+                 'total_persona_annotations', 'has_bbs_heritage', 'code_density', 'heading_count')
+    
+    word_count: int
+    total_core_signals: int
+    has_high_signal_density: bool
+    total_persona_annotations: int
+    has_bbs_heritage: bool
+    code_density: float
+    heading_count: int
+    
+    @classmethod
+    def from_analysis(cls, pattern_analysis: Dict) -> 'PatternSignalSummary':
+        """Build a summary from an extract_comprehensive_patterns result."""
+        try:
+            metadata, signal_analysis, persona_analysis, structure, bbs_heritage = _summary_sections(pattern_analysis)
+        except KeyError:
+            # Partial or foreign analysis dicts fall back to defaulted lookups
+            metadata = pattern_analysis.get('analysis_metadata', {})
+            signal_analysis = pattern_analysis.get('signal_analysis', {})
+            persona_analysis = pattern_analysis.get('persona_analysis', {})
+            structure = pattern_analysis.get('document_structure', {})
+            bbs_heritage = pattern_analysis.get('bbs_heritage', {})
+        
+        return cls(
+            word_count=metadata.get('word_count', 0),
+            total_core_signals=signal_analysis.get('total_core_signals', 0),
+            has_high_signal_density=signal_analysis.get('has_high_signal_density', False),
+            total_persona_annotations=persona_analysis.get('total_persona_annotations', 0),
+            has_bbs_heritage=any(p.get('has_pattern', False) for p in bbs_heritage.values()),
+            code_density=structure.get('code', {}).get('code_density', 0),
+            heading_count=structure.get('headings', {}).get('count', 0)
+        )
+
 
 class EnhancedFloatPatternDetector:
     """
@@ -31,6 +98,7 @@ class EnhancedFloatPatternDetector:
         self.logger = logger
         self.patterns = self._initialize_enhanced_patterns()
         self.tripartite_patterns = self._initialize_tripartite_patterns()
+        self.platform_scan = self._fuse_patterns(PLATFORM_PATTERN_NAMES)
         
         # Initialize plugin system - Issue #5
         self.plugin_manager = None
@@ -81,7 +149,9 @@ class EnhancedFloatPatternDetector:
             'relates_to': re.compile(r'relatesTo::\s*([^\n]+)', re.IGNORECASE),
             'remember_when': re.compile(r'rememberWhen::\s*([^\n]+)', re.IGNORECASE),
             'story_time': re.compile(r'storyTime::\s*([^\n]+)', re.IGNORECASE),
-            'echo_copy': re.compile(r'echoCopy::\s*([^\n]*?)(?:\s*::|$)', re.IGNORECASE),
+            # Greedy to the end of the line; a closing '::' is trimmed after matching, since a lazy
+            # body that retries \s*:: at every position is quadratic on long whitespace runs
+            'echo_copy': re.compile(r'echoCopy::\s*([^\n]*)', re.IGNORECASE),
             'mood_markers': re.compile(r'\[mood::\s*([^\]]*)\]', re.IGNORECASE),
             
             # Inline patterns (bracketed format) - Issue #3
@@ -92,15 +162,16 @@ class EnhancedFloatPatternDetector:
             'inline_generic': re.compile(r'\[([a-zA-Z][a-zA-Z0-9]*)::\s*([^\]]+)\]'),
             
             # Line-level :: patterns - Issue #3 (allow indentation and bullet points)
-            'line_mood': re.compile(r'^\s*[-*]?\s*mood::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_soundtrack': re.compile(r'^\s*[-*]?\s*soundtrack::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_body_check': re.compile(r'^\s*[-*]?\s*bodyCheck::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_impact': re.compile(r'^\s*[-*]?\s*impact::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_boundary': re.compile(r'^\s*[-*]?\s*boundary::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_progress': re.compile(r'^\s*[-*]?\s*progress::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_completed': re.compile(r'^\s*[-*]?\s*completed::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_issue': re.compile(r'^\s*[-*]?\s*issue::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
-            'line_generic': re.compile(r'^\s*[-*]?\s*([a-zA-Z][a-zA-Z0-9]*)::\s*(.+)$', re.MULTILINE),
+            # Indentation excludes newlines so the prefix cannot backtrack across blank lines
+            'line_mood': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?mood::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_soundtrack': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?soundtrack::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_body_check': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?bodyCheck::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_impact': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?impact::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_boundary': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?boundary::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_progress': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?progress::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_completed': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?completed::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_issue': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?issue::\s*(.+)$', re.MULTILINE | re.IGNORECASE),
+            'line_generic': re.compile(r'^[^\S\n]*(?:[-*][^\S\n]*)?([a-zA-Z][a-zA-Z0-9]*)::\s*(.+)$', re.MULTILINE),
             
             # Persona annotation system (from tripartite chunker)
             'persona_annotations': re.compile(r'\[([^:]+)::[^\]]+\]'),
@@ -140,16 +211,19 @@ class EnhancedFloatPatternDetector:
             'rotfield': re.compile(r'(?:rot|compost|ferment|decay)', re.IGNORECASE),
             
             # Document structure patterns (for any file type)
-            'headings': re.compile(r'^#+\s+(.+)$', re.MULTILINE),
-            'bullet_points': re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE),
-            'numbered_lists': re.compile(r'^\s*\d+\.\s+(.+)$', re.MULTILINE),
-            'action_items': re.compile(r'(?:TODO|FIXME|NOTE|IMPORTANT|HACK|XXX):\s*(.+)', re.IGNORECASE),
+            'headings': re.compile(r'^#+\s+(.+)$', re.MULTILINE | re.ASCII),
+            # Any line starting with '#'; indented lines leave the group empty (level 0)
+            'heading_levels': re.compile(r'^(?:(#+)|[^\S\n]+#)', re.MULTILINE),
+            'bullet_points': re.compile(r'^\s*[-*+]\s+(.+)$', re.MULTILINE | re.ASCII),
+            'numbered_lists': re.compile(r'^\s*\d+\.\s+(.+)$', re.MULTILINE | re.ASCII),
+            'action_items': re.compile(r'(?:TODO|FIXME|NOTE|IMPORTANT|HACK|XXX):\s*(.+)', re.IGNORECASE | re.ASCII),
+            'urgency_markers': re.compile(r'urgent|asap|critical', re.IGNORECASE),
             'citations': re.compile(r'\[([^\]]+)\]\(([^)]+)\)'),
             
             # Code patterns
             'code_blocks': re.compile(r'```(\w+)?\n(.*?)\n```', re.DOTALL),
             'inline_code': re.compile(r'`([^`]+)`'),
-            'api_endpoints': re.compile(r'(?:GET|POST|PUT|DELETE)\s+[/\w-]+'),
+            'api_endpoints': re.compile(r'(?:GET|POST|PUT|DELETE)\s+[/\w-]+', re.ASCII),
             
             # Technical patterns
             'implementation': re.compile(r'(?:implement|build|create|setup|configure)', re.IGNORECASE),
@@ -161,7 +235,7 @@ class EnhancedFloatPatternDetector:
             'story_markers': re.compile(r'(?:imagine|think of|like|similar to)', re.IGNORECASE),
             'experience': re.compile(r'(?:feel|experience|journey|path)', re.IGNORECASE),
             'philosophy': re.compile(r'(?:philosophy|approach|mindset|thinking)', re.IGNORECASE),
-            'personal_pronouns': re.compile(r'\b(?:I|you|we|your|my)\b'),
+            'personal_pronouns': re.compile(r'\b(?:I|you|we|your|my)\b', re.ASCII),
             'casual_language': re.compile(r'(?:basically|essentially|really|actually)', re.IGNORECASE),
             'examples': re.compile(r'(?:for example|such as|like when|imagine if)', re.IGNORECASE),
             
@@ -174,11 +248,16 @@ class EnhancedFloatPatternDetector:
             'sigils': re.compile(r'\{[■∴ψΞ|>~≈🕯️∞⧉📖⚑🛠️🧠]+\}'),
             
             # Contact information
-            'email_addresses': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'),
-            'phone_numbers': re.compile(r'\b\d{3}-\d{3}-\d{4}\b'),
-            'version_numbers': re.compile(r'v?\d+\.\d+(?:\.\d+)?'),
+            'email_addresses': re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', re.ASCII),
+            'phone_numbers': re.compile(r'\b\d{3}-\d{3}-\d{4}\b', re.ASCII),
+            'version_numbers': re.compile(r'v?\d+\.\d+(?:\.\d+)?', re.ASCII),
         }
     
+    def _fuse_patterns(self, pattern_names: Tuple[str, ...]):
+        """Combine case-insensitive patterns into one named-group alternation."""
+        alternation = '|'.join(f'(?P<{name}>{self.patterns[name].pattern})' for name in pattern_names)
+        return re.compile(alternation, re.IGNORECASE)
+    
     def _initialize_tripartite_patterns(self) -> Dict:
         """Initialize tripartite classification patterns from the chunker."""
         return {
@@ -228,6 +307,9 @@ class EnhancedFloatPatternDetector:
         if not content:
             return self._empty_pattern_result()
         
+        # Shared lowercase view for case-insensitive literal checks
+        content_lower = content.lower()
+        
         # Plugin-based pattern extraction - Issue #5
         plugin_patterns = {}
         if self.plugin_manager:
@@ -254,7 +336,7 @@ class EnhancedFloatPatternDetector:
         structure_patterns = self._extract_document_structure(content)
         
         # Content classification
-        classification = self._classify_content_tripartite(content)
+        classification = self._classify_content_tripartite(content, content_lower)
         
         # Signal analysis
         signal_analysis = self._analyze_signal_density(content, core_patterns, extended_patterns)
@@ -268,6 +350,9 @@ class EnhancedFloatPatternDetector:
         # Cross-reference potential
         cross_ref_analysis = self._analyze_cross_reference_potential(content, file_path)
         
+        # BBS heritage patterns
+        bbs_heritage = self._detect_bbs_heritage_patterns(content, content_lower)
+        
         return {
             'core_float_patterns': core_patterns,
             'extended_float_patterns': extended_patterns,
@@ -278,6 +363,7 @@ class EnhancedFloatPatternDetector:
             'platform_integration': platform_analysis,
             'persona_analysis': persona_analysis,
             'cross_reference_potential': cross_ref_analysis,
+            'bbs_heritage': bbs_heritage,
             'analysis_metadata': {
                 'content_length': len(content),
                 'word_count': len(content.split()),
@@ -325,6 +411,8 @@ class EnhancedFloatPatternDetector:
         for pattern_name in extended_pattern_names:
             if pattern_name in self.patterns:
                 matches = self.patterns[pattern_name].findall(content)
+                if pattern_name == 'echo_copy':
+                    matches = [_strip_closing_separator(match) for match in matches]
                 patterns[pattern_name] = {
                     'count': len(matches),
                     'matches': matches[:5],  # Fewer matches for metadata
@@ -375,7 +463,7 @@ class EnhancedFloatPatternDetector:
         
         return structure
     
-    def _classify_content_tripartite(self, content: str) -> Dict:
+    def _classify_content_tripartite(self, content: str, content_lower: str) -> Dict:
         """Classify content using tripartite system (concept/framework/metaphor)."""
         scores = {'concept': 0, 'framework': 0, 'metaphor': 0}
         pattern_matches = {'concept': [], 'framework': [], 'metaphor': []}
@@ -392,7 +480,7 @@ class EnhancedFloatPatternDetector:
                         pattern_matches[domain].append(pattern_name)
         
         # Apply edge case rules (from tripartite chunker)
-        self._apply_tripartite_edge_cases(content, scores)
+        self._apply_tripartite_edge_cases(content, content_lower, scores)
         
         # Determine primary domain
         primary_domain = max(scores, key=scores.get) if any(scores.values()) else 'concept'
@@ -406,10 +494,8 @@ class EnhancedFloatPatternDetector:
             'explanation': self._explain_tripartite_classification(primary_domain, pattern_matches[primary_domain], scores)
         }
     
-    def _apply_tripartite_edge_cases(self, content: str, scores: Dict):
+    def _apply_tripartite_edge_cases(self, content: str, content_lower: str, scores: Dict):
         """Apply edge case rules from tripartite chunker."""
-        content_lower = content.lower()
-        
         # Strong concept indicators
         if any(marker in content for marker in ['ctx::', 'signal::', 'highlight::']):
             scores['concept'] += 5
@@ -425,8 +511,8 @@ class EnhancedFloatPatternDetector:
         if any(platform in content_lower for platform in build_platforms):
             scores['framework'] += 4
         
-        # Thought buckets
-        if re.search(r'(?:thought|build)\s+buckets?', content_lower):
+        # Thought buckets (cheap substring check rejects most content before the regex)
+        if 'bucket' in content_lower and self.patterns['thought_buckets'].search(content_lower):
             scores['concept'] += 3
         
         # Mood tracking
@@ -473,17 +559,14 @@ class EnhancedFloatPatternDetector:
     
     def _analyze_platform_integration(self, content: str) -> Dict:
         """Analyze build platform and tool integration patterns."""
-        platforms = {}
-        
-        platform_patterns = ['lovable_refs', 'v0_refs', 'magic_patterns', 'github_refs', 'thought_buckets']
-        
-        for pattern_name in platform_patterns:
-            if pattern_name in self.patterns:
-                matches = self.patterns[pattern_name].findall(content)
-                platforms[pattern_name] = {
-                    'count': len(matches),
-                    'has_pattern': len(matches) > 0
-                }
+        counts = Counter(match.lastgroup for match in self.platform_scan.finditer(content))
+        platforms = {
+            pattern_name: {
+                'count': counts[pattern_name],
+                'has_pattern': counts[pattern_name] > 0
+            }
+            for pattern_name in PLATFORM_PATTERN_NAMES
+        }
         
         total_platform_refs = sum(p['count'] for p in platforms.values())
         
@@ -497,16 +580,12 @@ class EnhancedFloatPatternDetector:
     def _analyze_persona_annotations(self, content: str) -> Dict:
         """Analyze persona annotation system patterns."""
         personas = {}
-        
-        persona_patterns = ['any_combo', 'lf1m_notes', 'qtb_notes', 'karen_notes', 'sysop_notes', 'little_fucker']
-        
-        for pattern_name in persona_patterns:
-            if pattern_name in self.patterns:
-                matches = self.patterns[pattern_name].findall(content)
-                personas[pattern_name] = {
-                    'count': len(matches),
-                    'has_pattern': len(matches) > 0
-                }
+        for pattern_name in PERSONA_PATTERN_NAMES:
+            count = len(self.patterns[pattern_name].findall(content))
+            personas[pattern_name] = {
+                'count': count,
+                'has_pattern': count > 0
+            }
         
         # Extract all persona annotations
         all_persona_matches = self.patterns['persona_annotations'].findall(content)
@@ -525,6 +604,20 @@ class EnhancedFloatPatternDetector:
             'persona_diversity': len(persona_counts)
         }
     
+    def _detect_bbs_heritage_patterns(self, content: str, content_lower: str) -> Dict:
+        """Detect BBS heritage patterns (float.dis, float.diis, file_id.diz)."""
+        bbs_heritage = {}
+        
+        for pattern_name, literal in BBS_PATTERN_LITERALS.items():
+            # Skip the regex scan when its required literal is absent
+            count = len(self.patterns[pattern_name].findall(content)) if literal in content_lower else 0
+            bbs_heritage[pattern_name] = {
+                'count': count,
+                'has_pattern': count > 0
+            }
+        
+        return bbs_heritage
+    
     def _analyze_cross_reference_potential(self, content: str, file_path: Optional[Path] = None) -> Dict:
         """Analyze potential for cross-referencing with other content."""
         
@@ -573,8 +666,8 @@ class EnhancedFloatPatternDetector:
         
         # Date patterns
         date_patterns = [
-            re.compile(r'\d{4}-\d{2}-\d{2}'),  # YYYY-MM-DD
-            re.compile(r'\d{2}/\d{2}/\d{4}'),  # MM/DD/YYYY
+            re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII),  # YYYY-MM-DD
+            re.compile(r'\d{2}/\d{2}/\d{4}', re.ASCII),  # MM/DD/YYYY
             re.compile(r'(?:yesterday|today|tomorrow)', re.IGNORECASE),
             re.compile(r'(?:last|next)\s+(?:week|month|year)', re.IGNORECASE)
         ]
@@ -612,15 +705,10 @@ class EnhancedFloatPatternDetector:
     
     def _analyze_heading_levels(self, content: str) -> Dict:
         """Analyze heading hierarchy in content."""
-        lines = content.split('\n')
-        heading_levels = {}
-        
-        for line in lines:
-            if line.strip().startswith('#'):
-                level = len(line) - len(line.lstrip('#'))
-                heading_levels[level] = heading_levels.get(level, 0) + 1
-        
-        return heading_levels
+        heading_levels = Counter(
+            len(match.group(1) or '') for match in self.patterns['heading_levels'].finditer(content)
+        )
+        return dict(heading_levels)
     
     def _identify_dominant_signal_type(self, core_patterns: Dict) -> Optional[str]:
         """Identify the most prominent signal type."""
@@ -669,6 +757,7 @@ class EnhancedFloatPatternDetector:
             'platform_integration': {'total_platform_references': 0, 'has_platform_integration': False},
             'persona_analysis': {'total_persona_annotations': 0, 'has_persona_system': False},
             'cross_reference_potential': {'cross_reference_score': 0.0},
+            'bbs_heritage': {},
             'analysis_metadata': {
                 'content_length': 0,
                 'word_count': 0,
@@ -679,38 +768,22 @@ class EnhancedFloatPatternDetector:
     
     def is_high_priority_content(self, pattern_analysis: Dict) -> bool:
         """Determine if content should be prioritized based on pattern analysis."""
-        
-        # High priority if it has core FLOAT signals
-        core_signals = pattern_analysis.get('signal_analysis', {}).get('total_core_signals', 0)
-        if core_signals > 0:
-            return True
-        
-        # High priority if it has persona annotations
-        persona_count = pattern_analysis.get('persona_analysis', {}).get('total_persona_annotations', 0)
-        if persona_count > 0:
-            return True
-        
-        # High priority if it has high signal density
-        if pattern_analysis.get('signal_analysis', {}).get('has_high_signal_density', False):
-            return True
-        
-        # High priority if it has BBS heritage patterns
-        bbs_patterns = ['float_dis', 'float_diis', 'file_id_diz']
-        content = str(pattern_analysis)  # Quick check in serialized form
-        if any(pattern in content.lower() for pattern in bbs_patterns):
-            return True
-        
-        return False
+        summary = PatternSignalSummary.from_analysis(pattern_analysis)
+        
+        # High priority if it has core FLOAT signals, persona annotations,
+        # high signal density or BBS heritage patterns
+        return (summary.total_core_signals > 0
+                or summary.total_persona_annotations > 0
+                or summary.has_high_signal_density
+                or summary.has_bbs_heritage)
     
     def get_content_complexity_assessment(self, pattern_analysis: Dict) -> str:
         """Assess content complexity based on pattern analysis."""
         
-        metadata = pattern_analysis.get('analysis_metadata', {})
-        word_count = metadata.get('word_count', 0)
-        
-        signal_count = pattern_analysis.get('signal_analysis', {}).get('total_core_signals', 0)
-        structure = pattern_analysis.get('document_structure', {})
-        code_density = structure.get('code', {}).get('code_density', 0)
+        summary = PatternSignalSummary.from_analysis(pattern_analysis)
+        word_count = summary.word_count
+        signal_count = summary.total_core_signals
+        code_density = summary.code_density
         
         # Calculate complexity score
         complexity_score = 0
@@ -736,7 +809,7 @@ class EnhancedFloatPatternDetector:
             complexity_score += 1
         
         # Structure complexity
-        heading_count = structure.get('headings', {}).get('count', 0)
+        heading_count = summary.heading_count
         if heading_count > 20:
             complexity_score += 2
         elif heading_count > 10:
@@ -752,24 +825,26 @@ class EnhancedFloatPatternDetector:
     
     def extract_actionable_insights(self, pattern_analysis: Dict) -> List[Dict]:
         """Extract actionable insights from pattern analysis."""
-        insights = []
+        get_section = pattern_analysis.get
         
         # Check for action items
-        structure = pattern_analysis.get('document_structure', {})
-        action_items = structure.get('action_items', {}).get('items', [])
+        action_items = get_section('document_structure', _EMPTY).get('action_items', _EMPTY).get('items', ())
         
-        for item in action_items:
-            insights.append({
+        urgency_markers = self.patterns['urgency_markers']
+        insights = [
+            {
                 'type': 'action_item',
                 'content': item,
-                'priority': 'high' if any(word in item.lower() for word in ['urgent', 'asap', 'critical']) else 'medium',
+                'priority': 'high' if urgency_markers.search(item) else 'medium',
                 'source': 'document_structure'
-            })
+            }
+            for item in action_items
+        ]
+        append_insight = insights.append
         
         # Check for FLOAT dispatch patterns
-        core_patterns = pattern_analysis.get('core_float_patterns', {})
-        if core_patterns.get('float_dispatch', {}).get('has_pattern', False):
-            insights.append({
+        if get_section('core_float_patterns', _EMPTY).get('float_dispatch', _EMPTY).get('has_pattern', False):
+            append_insight({
                 'type': 'float_dispatch',
                 'content': 'Content contains FLOAT dispatch patterns',
                 'priority': 'high',
@@ -777,19 +852,19 @@ class EnhancedFloatPatternDetector:
             })
         
         # Check for cross-reference opportunities
-        cross_ref = pattern_analysis.get('cross_reference_potential', {})
-        if cross_ref.get('cross_reference_score', 0) > 0.5:
-            insights.append({
+        cross_reference_score = get_section('cross_reference_potential', _EMPTY).get('cross_reference_score', 0)
+        if cross_reference_score > 0.5:
+            append_insight({
                 'type': 'cross_reference_opportunity',
-                'content': f"High cross-reference potential (score: {cross_ref.get('cross_reference_score', 0):.2f})",
+                'content': f"High cross-reference potential (score: {cross_reference_score:.2f})",
                 'priority': 'medium',
                 'source': 'cross_reference_analysis'
             })
         
         # Check for platform integration opportunities
-        platform = pattern_analysis.get('platform_integration', {})
+        platform = get_section('platform_integration', _EMPTY)
         if platform.get('has_platform_integration', False):
-            insights.append({
+            append_insight({
                 'type': 'platform_integration',
                 'content': f"Content references external platforms ({platform.get('total_platform_references', 0)} references)",
                 'priority': 'medium',
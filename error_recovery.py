@@ -3,21 +3,76 @@ Error recovery system for FLOAT file processing
 Handles various error conditions with retry logic and quarantine management
 """
 
+import os
+import errno
+import heapq
 import shutil
+import stat
 import json
 import traceback
 from pathlib import Path
 from typing import Dict, Optional, Callable, Any
 import time
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Files written next to a quarantined file (older quarantines may also have .error.txt)
+ERROR_LOG_SUFFIX = '.error.json'
+TRACEBACK_SUFFIX = '.error.traceback.txt'
+ERROR_ARTIFACT_SUFFIXES = (ERROR_LOG_SUFFIX, '.error.txt', TRACEBACK_SUFFIX)
+
+# Mode applied when retrying after a permission error (rw-r--r--)
+RETRY_FILE_MODE = stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH
+
+
+def _write_json(path: Path, data: Dict):
+    """Write an indented JSON document, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _move_file(source: Path, destination: Path):
+    """Rename within a filesystem, falling back to shutil.move across devices"""
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(destination))
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON document, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
 class FileProcessingRecovery:
     """Error recovery system for file processing"""
     
-    def __init__(self, dropzone_path: Path, max_retries: int = 3):
+    # Error handling folders already created in this process, shared across instances
+    _created_folders = set()
+    
+    def __init__(self, dropzone_path: Path, max_retries: int = 3, retry_scheduler: Optional[Callable] = None):
         self.dropzone_path = dropzone_path
         self.max_retries = max_retries
         
+        # Optional callable (file_path, processor_func, retry_count, delay) that takes over
+        # waiting for retries; without one, retries block the calling thread
+        self.retry_scheduler = retry_scheduler
+        
         # Create error handling directories
         self.error_folder = dropzone_path / ".errors"
         self.retry_folder = dropzone_path / ".retry" 
@@ -25,48 +80,89 @@ class FileProcessingRecovery:
         self.processed_folder = dropzone_path / ".processed"
         
         for folder in [self.error_folder, self.retry_folder, self.quarantine_folder, self.processed_folder]:
-            folder.mkdir(exist_ok=True)
+            folder_key = str(folder)
+            if folder_key not in self._created_folders:
+                os.makedirs(folder, exist_ok=True)
+                self._created_folders.add(folder_key)
         
         # Track retry history
         self.retry_history = {}
+        
+        # Rate limit for file-not-found logs so watcher storms don't flood .errors
+        self.file_not_found_log_limit = 20
+        self.file_not_found_log_window = 60.0
+        self._file_not_found_window_start = time.monotonic()
+        self._file_not_found_window_count = 0
+        self.dropped_file_not_found_logs = 0
+        
+        # Error handlers keyed by exception class; subclasses resolve through the MRO
+        self._error_handlers = {
+            MemoryError: self._handle_memory_error,
+            PermissionError: self._handle_permission_error,
+            FileNotFoundError: self._handle_file_not_found,
+        }
+        
+        # Parsed quarantine error logs keyed by path: (mtime_ns, summary record)
+        self.error_log_cache = {}
+        self.error_log_cache_size = 5000
     
     def process_with_recovery(self, file_path: Path, processor_func: Callable, retry_count: int = 0) -> Dict:
-        """Process file with comprehensive error recovery"""
-        try:
-            # Call the processor function
-            result = processor_func(file_path)
-            
-            # If successful, clear retry history
-            if str(file_path) in self.retry_history:
-                del self.retry_history[str(file_path)]
-            
-            return result
-            
-        except MemoryError as e:
-            return self._handle_memory_error(file_path, e, processor_func, retry_count)
-            
-        except PermissionError as e:
-            return self._handle_permission_error(file_path, e, processor_func, retry_count)
-            
-        except FileNotFoundError as e:
-            return self._handle_file_not_found(file_path, e)
+        """Process file with comprehensive error recovery
+        
+        Retries loop in place: a handler returns None when the file should be
+        attempted again, or the final result dict otherwise.
+        """
+        while True:
+            try:
+                # Call the processor function
+                result = processor_func(file_path)
+                
+                # If successful, clear retry history
+                if str(file_path) in self.retry_history:
+                    del self.retry_history[str(file_path)]
+                
+                return result
+                
+            except Exception as e:
+                handler = self._get_error_handler(type(e))
+                outcome = handler(file_path, e, processor_func, retry_count)
             
-        except Exception as e:
-            return self._handle_general_error(file_path, e, processor_func, retry_count)
+            if outcome is not None:
+                return outcome
+            retry_count += 1
+    
+    def _get_error_handler(self, error_class: type) -> Callable:
+        """Resolve the handler for an exception class, defaulting to the general retry path"""
+        handlers = self._error_handlers
+        for cls in error_class.__mro__:
+            handler = handlers.get(cls)
+            if handler is not None:
+                return handler
+        return self._handle_general_error
+    
+    def _stat_file(self, file_path: Path) -> Optional[os.stat_result]:
+        """Stat a file once, returning None if it is missing or unreadable"""
+        try:
+            return os.stat(file_path)
+        except OSError:
+            return None
     
     def _handle_memory_error(self, file_path: Path, error: Exception, processor_func: Callable, retry_count: int) -> Dict:
         """Handle memory errors by moving large files"""
         print(f"💾 Memory error processing {file_path.name}, moving to quarantine")
         
+        file_stat = self._stat_file(file_path)
+        now = datetime.now()
+        
         # Create error details
         error_details = {
             'error_type': 'memory_error',
             'error_message': str(error),
-            'file_size': file_path.stat().st_size if file_path.exists() else 'unknown',
-            'timestamp': datetime.now().isoformat()
+            'file_size': file_stat.st_size if file_stat else 'unknown',
+            'timestamp': now.isoformat()
         }
         
-        quarantine_path = self._quarantine_file(file_path, f"Memory error: {error}", error_details)
+        quarantine_path = self._quarantine_file(file_path, f"Memory error: {error}", error_details, now)
         
         return {
             'success': False,
@@ -76,31 +172,31 @@ class FileProcessingRecovery:
             'quarantine_path': str(quarantine_path)
         }
     
-    def _handle_permission_error(self, file_path: Path, error: Exception, processor_func: Callable, retry_count: int) -> Dict:
-        """Handle permission errors with retry after delay"""
+    def _handle_permission_error(self, file_path: Path, error: Exception, processor_func: Callable, retry_count: int) -> Optional[Dict]:
+        """Handle permission errors with retry after delay (None means retry now)"""
         print(f"🔒 Permission error processing {file_path.name}")
         
         if retry_count < self.max_retries:
+            if self.retry_scheduler:
+                self._fix_permissions(file_path)
+                return self._schedule_retry(file_path, processor_func, retry_count, 5, error)
+            
             print(f"   Waiting 5 seconds before retry {retry_count + 1}/{self.max_retries}")
             time.sleep(5)
             
-            # Try to fix permissions if possible
-            try:
-                import stat
-                file_path.chmod(stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
-            except:
-                pass
+            self._fix_permissions(file_path)
             
-            return self.process_with_recovery(file_path, processor_func, retry_count + 1)
+            return None
         else:
+            now = datetime.now()
             error_details = {
                 'error_type': 'permission_error',
                 'error_message': str(error),
                 'retry_count': retry_count,
-                'timestamp': datetime.now().isoformat()
+                'timestamp': now.isoformat()
             }
             
-            quarantine_path = self._quarantine_file(file_path, f"Permission error after {retry_count} retries: {error}", error_details)
+            quarantine_path = self._quarantine_file(file_path, f"Permission error after {retry_count} retries: {error}", error_details, now)
             
             return {
                 'success': False,
@@ -110,22 +206,56 @@ class FileProcessingRecovery:
                 'quarantine_path': str(quarantine_path)
             }
     
-    def _handle_file_not_found(self, file_path: Path, error: Exception) -> Dict:
+    def _fix_permissions(self, file_path: Path):
+        """Try to make the file readable before retrying"""
+        try:
+            file_path.chmod(RETRY_FILE_MODE)
+        except:
+            pass
+    
+    def _schedule_retry(self, file_path: Path, processor_func: Callable, retry_count: int,
+                        wait_time: float, error: Exception) -> Dict:
+        """Hand the next attempt to the retry scheduler instead of sleeping"""
+        print(f"   Scheduling retry {retry_count + 1}/{self.max_retries} in {wait_time} seconds")
+        self.retry_scheduler(file_path, processor_func, retry_count + 1, wait_time)
+        
+        return {
+            'success': False,
+            'error': 'retry_scheduled',
+            'error_type': type(error).__name__,
+            'error_message': str(error),
+            'quarantined': False,
+            'retry_count': retry_count + 1,
+            'retry_at': time.monotonic() + wait_time
+        }
+    
+    def _handle_file_not_found(self, file_path: Path, error: Exception, processor_func: Optional[Callable] = None,
+                               retry_count: int = 0) -> Dict:
         """Handle case where file disappeared"""
         print(f"❓ File not found: {file_path.name}")
         
+        if not self._take_file_not_found_log_slot():
+            self.dropped_file_not_found_logs += 1
+            return {
+                'success': False,
+                'error': 'file_not_found',
+                'error_message': str(error),
+                'quarantined': False,
+                'error_log': None
+            }
+        
         # Log the error but don't quarantine since file doesn't exist
-        error_log_path = self.error_folder / f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{file_path.name}.error.json"
+        now = datetime.now()
+        error_log_path = self.error_folder / f"{now.strftime('%Y%m%d_%H%M%S')}_{file_path.name}.error.json"
         
         error_details = {
             'error_type': 'file_not_found',
             'error_message': str(error),
             'original_path': str(file_path),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now.isoformat()
         }
         
-        with open(error_log_path, 'w') as f:
-            json.dump(error_details, f, indent=2)
+        _write_json(error_log_path, error_details)
         
         return {
             'success': False,
@@ -135,21 +265,37 @@ class FileProcessingRecovery:
             'error_log': str(error_log_path)
         }
     
-    def _handle_general_error(self, file_path: Path, error: Exception, processor_func: Callable, retry_count: int) -> Dict:
-        """Handle general errors with retry logic"""
+    def _take_file_not_found_log_slot(self) -> bool:
+        """Allow up to file_not_found_log_limit error logs per window"""
+        current_time = time.monotonic()
+        if current_time - self._file_not_found_window_start >= self.file_not_found_log_window:
+            self._file_not_found_window_start = current_time
+            self._file_not_found_window_count = 0
+        
+        if self._file_not_found_window_count >= self.file_not_found_log_limit:
+            return False
+        
+        self._file_not_found_window_count += 1
+        return True
+    
+    def _handle_general_error(self, file_path: Path, error: Exception, processor_func: Callable, retry_count: int) -> Optional[Dict]:
+        """Handle general errors with retry logic (None means retry now)"""
         error_type = type(error).__name__
-        print(f"⚠️ {error_type} processing {file_path.name}: {error}")
+        error_message = str(error)
+        now = datetime.now()
+        print(f"⚠️ {error_type} processing {file_path.name}: {error_message}")
         
         # Track retry history
         file_key = str(file_path)
         if file_key not in self.retry_history:
-            self.retry_history[file_key] = []
+            # Bounded so a file that keeps failing cannot grow its history without limit
+            self.retry_history[file_key] = deque(maxlen=self.max_retries + 1)
         
         self.retry_history[file_key].append({
             'attempt': retry_count + 1,
             'error_type': error_type,
-            'error_message': str(error),
-            'timestamp': datetime.now().isoformat()
+            'error_message': error_message,
+            'timestamp': now.isoformat()
         })
         
         if retry_count < self.max_retries:
@@ -157,36 +303,26 @@ class FileProcessingRecovery:
             
             # Exponential backoff
             wait_time = 2 ** retry_count
+            if self.retry_scheduler:
+                return self._schedule_retry(file_path, processor_func, retry_count, wait_time, error)
+            
             print(f"   Waiting {wait_time} seconds...")
             time.sleep(wait_time)
             
-            # Move to retry folder temporarily
-            retry_path = self.retry_folder / f"{retry_count}_{datetime.now().strftime('%H%M%S')}_{file_path.name}"
-            shutil.copy2(str(file_path), str(retry_path))
-            
-            try:
-                result = self.process_with_recovery(retry_path, processor_func, retry_count + 1)
-                # If successful, remove the retry copy
-                if result.get('success'):
-                    retry_path.unlink()
-                return result
-            except Exception as e:
-                # Clean up retry file on failure
-                if retry_path.exists():
-                    retry_path.unlink()
-                raise
+            # Retry in place; attempt state lives in self.retry_history
+            return None
         else:
             print(f"❌ Max retries exceeded for {file_path.name}, quarantining")
             
             error_details = {
                 'error_type': error_type,
-                'error_message': str(error),
-                'retry_history': self.retry_history.get(file_key, []),
-                'traceback': traceback.format_exc(),
-                'timestamp': datetime.now().isoformat()
+                'error_message': error_message,
+                'retry_history': list(self.retry_history.get(file_key, ())),
+                'timestamp': now.isoformat()
             }
             
-            quarantine_path = self._quarantine_file(file_path, f"Max retries exceeded: {error}", error_details)
+            quarantine_path = self._quarantine_file(file_path, f"Max retries exceeded: {error_message}", error_details, now,
+                                                    traceback_text=traceback.format_exc())
             
             # Clear retry history
             if file_key in self.retry_history:
@@ -196,27 +332,28 @@ class FileProcessingRecovery:
                 'success': False,
                 'error': 'max_retries_exceeded',
                 'error_type': error_type,
-                'error_message': str(error),
+                'error_message': error_message,
                 'quarantined': True,
                 'quarantine_path': str(quarantine_path),
                 'retry_count': retry_count
             }
     
-    def _quarantine_file(self, file_path: Path, reason: str, error_details: Dict) -> Path:
-        """Move file to quarantine with error details"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    def _quarantine_file(self, file_path: Path, reason: str, error_details: Dict, now: Optional[datetime] = None,
+                         traceback_text: Optional[str] = None) -> Path:
+        """Move file to quarantine with error details (traceback kept in a plain-text sibling)"""
+        timestamp = (now or datetime.now()).strftime('%Y%m%d_%H%M%S')
         quarantine_name = f"{timestamp}_{file_path.name}"
         quarantine_path = self.quarantine_folder / quarantine_name
         
         # Move or copy file (copy if move fails)
         try:
-            shutil.move(str(file_path), str(quarantine_path))
+            _move_file(file_path, quarantine_path)
         except Exception as e:
             print(f"   Failed to move file, copying instead: {e}")
             shutil.copy2(str(file_path), str(quarantine_path))
         
         # Create detailed error log
-        error_log = quarantine_path.with_suffix(quarantine_path.suffix + '.error.json')
+        error_log = quarantine_path.with_suffix(quarantine_path.suffix + ERROR_LOG_SUFFIX)
         error_info = {
             'file': file_path.name,
             'original_path': str(file_path),
@@ -225,30 +362,44 @@ class FileProcessingRecovery:
             'details': error_details
         }
         
-        with open(error_log, 'w') as f:
-            json.dump(error_info, f, indent=2)
-        
-        # Create human-readable error summary
-        error_summary = quarantine_path.with_suffix(quarantine_path.suffix + '.error.txt')
-        with open(error_summary, 'w') as f:
-            f.write(f"FLOAT Processing Error Report\n")
-            f.write(f"{'=' * 50}\n\n")
-            f.write(f"File: {file_path.name}\n")
-            f.write(f"Quarantined: {timestamp}\n")
-            f.write(f"Reason: {reason}\n")
-            f.write(f"\nError Type: {error_details.get('error_type', 'Unknown')}\n")
-            f.write(f"Error Message: {error_details.get('error_message', 'No message')}\n")
-            
-            if 'retry_history' in error_details:
-                f.write(f"\nRetry History:\n")
-                for attempt in error_details['retry_history']:
-                    f.write(f"  - Attempt {attempt['attempt']}: {attempt['error_type']} at {attempt['timestamp']}\n")
-            
-            if 'traceback' in error_details:
-                f.write(f"\nFull Traceback:\n{error_details['traceback']}\n")
+        _write_json(error_log, error_info)
+        
+        if traceback_text:
+            quarantine_path.with_suffix(quarantine_path.suffix + TRACEBACK_SUFFIX).write_text(traceback_text)
         
         return quarantine_path
     
+    def render_error_report(self, quarantine_path: Path) -> str:
+        """Render the human-readable report for a quarantined file from its error log"""
+        error_log = quarantine_path.with_suffix(quarantine_path.suffix + ERROR_LOG_SUFFIX)
+        error_info = _read_json(error_log)
+        error_details = error_info.get('details', {})
+        
+        traceback_file = quarantine_path.with_suffix(quarantine_path.suffix + TRACEBACK_SUFFIX)
+        traceback_text = traceback_file.read_text() if traceback_file.exists() else error_details.get('traceback')
+        
+        lines = [
+            "FLOAT Processing Error Report",
+            '=' * 50,
+            "",
+            f"File: {error_info.get('file', 'unknown')}",
+            f"Quarantined: {error_info.get('quarantined', 'unknown')}",
+            f"Reason: {error_info.get('reason', 'unknown')}",
+            "",
+            f"Error Type: {error_details.get('error_type', 'Unknown')}",
+            f"Error Message: {error_details.get('error_message', 'No message')}",
+        ]
+        
+        if 'retry_history' in error_details:
+            lines.extend(["", "Retry History:"])
+            for attempt in error_details['retry_history']:
+                lines.append(f"  - Attempt {attempt['attempt']}: {attempt['error_type']} at {attempt['timestamp']}")
+        
+        if traceback_text:
+            lines.extend(["", "Full Traceback:", traceback_text])
+        
+        return '\n'.join(lines) + '\n'
+    
     def move_to_processed(self, file_path: Path) -> Path:
         """Move successfully processed file to processed folder"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -256,70 +407,109 @@ class FileProcessingRecovery:
         processed_path = self.processed_folder / processed_name
         
         try:
-            shutil.move(str(file_path), str(processed_path))
+            _move_file(file_path, processed_path)
             return processed_path
         except Exception as e:
             print(f"⚠️ Failed to move to processed folder: {e}")
             return file_path
     
+    def defer_for_later(self, file_path: Path) -> Path:
+        """Move a file to the retry folder to be picked up again later"""
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        retry_path = self.retry_folder / f"{timestamp}_{file_path.name}"
+        
+        try:
+            _move_file(file_path, retry_path)
+            return retry_path
+        except Exception as e:
+            print(f"⚠️ Failed to move to retry folder: {e}")
+            return file_path
+    
     def get_quarantine_summary(self) -> Dict:
         """Get summary of quarantined files"""
-        quarantined_files = list(self.quarantine_folder.glob('*'))
-        error_logs = list(self.quarantine_folder.glob('*.error.json'))
+        # Partition the folder in a single scandir pass; like Path.glob('*'), dotfiles are included
+        error_logs = []
+        total_quarantined = 0
+        with os.scandir(self.quarantine_folder) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(ERROR_LOG_SUFFIX):
+                    error_logs.append(entry)
+                elif not name.endswith(ERROR_ARTIFACT_SUFFIXES):
+                    total_quarantined += 1
         
         summary = {
-            'total_quarantined': len([f for f in quarantined_files if not f.name.endswith('.error.json') and not f.name.endswith('.error.txt')]),
+            'total_quarantined': total_quarantined,
             'by_error_type': {},
-            'recent_errors': []
+            'recent_errors': [],
+            'dropped_file_not_found_logs': self.dropped_file_not_found_logs
         }
         
         # Analyze error logs
         for error_log in error_logs:
             try:
-                with open(error_log, 'r') as f:
-                    error_info = json.load(f)
-                    error_type = error_info.get('details', {}).get('error_type', 'unknown')
-                    
-                    if error_type not in summary['by_error_type']:
-                        summary['by_error_type'][error_type] = 0
-                    summary['by_error_type'][error_type] += 1
-                    
-                    # Add to recent errors
-                    summary['recent_errors'].append({
-                        'file': error_info.get('file', 'unknown'),
-                        'error_type': error_type,
-                        'timestamp': error_info.get('quarantined', 'unknown'),
-                        'reason': error_info.get('reason', 'unknown')
-                    })
+                record = self._read_error_log_record(error_log)
+                error_type = record['error_type']
+                
+                if error_type not in summary['by_error_type']:
+                    summary['by_error_type'][error_type] = 0
+                summary['by_error_type'][error_type] += 1
+                
+                # Add to recent errors
+                summary['recent_errors'].append(record)
             except Exception as e:
-                print(f"⚠️ Failed to read error log {error_log}: {e}")
+                print(f"⚠️ Failed to read error log {error_log.path}: {e}")
         
-        # Sort recent errors by timestamp
-        summary['recent_errors'].sort(key=lambda x: x['timestamp'], reverse=True)
-        summary['recent_errors'] = summary['recent_errors'][:10]  # Keep only 10 most recent
+        # Keep only the 10 most recent (partial selection, no full sort), copied so
+        # callers cannot mutate cached records
+        recent = heapq.nlargest(10, summary['recent_errors'], key=lambda x: x['timestamp'])
+        summary['recent_errors'] = [dict(record) for record in recent]
         
         return summary
     
+    def _read_error_log_record(self, error_log: os.DirEntry) -> Dict:
+        """Summarize a quarantine error log, reusing the cached parse while its mtime is unchanged"""
+        mtime_ns = error_log.stat().st_mtime_ns
+        cached = self.error_log_cache.get(error_log.path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
+        error_info = _read_json(Path(error_log.path))
+        record = {
+            'file': error_info.get('file', 'unknown'),
+            'error_type': error_info.get('details', {}).get('error_type', 'unknown'),
+            'timestamp': error_info.get('quarantined', 'unknown'),
+            'reason': error_info.get('reason', 'unknown')
+        }
+        
+        # Evict the oldest entry once the cache is full
+        if error_log.path not in self.error_log_cache and len(self.error_log_cache) >= self.error_log_cache_size:
+            del self.error_log_cache[next(iter(self.error_log_cache))]
+        self.error_log_cache[error_log.path] = (mtime_ns, record)
+        
+        return record
+    
     def cleanup_old_files(self, days_to_keep: int = 7):
         """Clean up old files from error handling folders"""
-        import time
-        current_time = time.time()
-        cutoff_time = current_time - (days_to_keep * 24 * 60 * 60)
+        # Integer nanoseconds: exact comparison against st_mtime_ns, no float rounding
+        cutoff_ns = time.time_ns() - days_to_keep * 24 * 60 * 60 * 1_000_000_000
         
         folders_to_clean = [self.error_folder, self.retry_folder, self.processed_folder]
         total_cleaned = 0
         
         for folder in folders_to_clean:
-            for file_path in folder.iterdir():
-                if file_path.stat().st_mtime < cutoff_time:
+            # DirEntry caches the stat result and answers is_file/is_dir from the directory listing
+            with os.scandir(folder) as entries:
+                for entry in entries:
                     try:
-                        if file_path.is_file():
-                            file_path.unlink()
-                        elif file_path.is_dir():
-                            shutil.rmtree(file_path)
-                        total_cleaned += 1
+                        if entry.stat().st_mtime_ns < cutoff_ns:
+                            if entry.is_file():
+                                os.unlink(entry.path)
+                            elif entry.is_dir():
+                                shutil.rmtree(entry.path)
+                            total_cleaned += 1
                     except Exception as e:
-                        print(f"⚠️ Failed to clean up {file_path}: {e}")
+                        print(f"⚠️ Failed to clean up {entry.path}: {e}")
         
         if total_cleaned > 0:
             print(f"🧹 Cleaned up {total_cleaned} old files")
@@ -3,17 +3,279 @@ FLOAT .dis Template System - Fixed Templater Syntax
 Generates {filename}.float_dis.md files with YAML frontmatter and proper static content
 """
 
+import re
+import bisect
 import json
+import functools
+import hashlib
 import yaml
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Optional, TextIO, Tuple
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# Use the libyaml-backed emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+# Strings that can be written as plain YAML scalars without resolving to another type
+_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_./-]*')
+_YAML_KEYWORDS = frozenset(['yes', 'no', 'true', 'false', 'on', 'off', 'null'])
+# Characters YAML readers reject or treat as line breaks inside double-quoted scalars
+_YAML_UNSAFE_CHARS_RE = re.compile('[\x7f-\x9f\u2028\u2029\ufffe\uffff]')
+
+# Units for human-readable file sizes, 1024 apart
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Output buffer for .dis files, larger than a typical rendered file
+DIS_WRITE_BUFFER_SIZE = 64 * 1024
+
+# YAML comment on the first frontmatter line recording what a .dis file was generated from
+_CACHE_KEY_PREFIX = '# dis-cache-key: '
+_CACHE_KEY_LINE_LENGTH = 128
+
+# Size tag boundaries (exclusive upper limits: < 10KB, < 100KB, < 1MB) and their tags
+_SIZE_TAG_LIMITS = (10 * 1024, 100 * 1024, 1024 * 1024)
+_SIZE_TAGS = ('size/tiny', 'size/small', 'size/medium', 'size/large')
+
+# Tripartite confidence tags by level: <= 0.5, > 0.5, > 0.8
+_CONFIDENCE_TAGS = ('tripartite/low-confidence', 'tripartite/medium-confidence', 'tripartite/high-confidence')
+
+# Frontmatter document structure when the analysis has none
+_DEFAULT_DOCUMENT_STRUCTURE = MappingProxyType({
+    'heading_count': 0,
+    'list_density': 0,
+    'code_density': 0.0,
+    'action_items': 0
+})
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Obsidian file-type tag for each known source extension
+_EXTENSION_TAGS = MappingProxyType({
+    '.json': 'data/json',
+    '.pdf': 'document/pdf',
+    '.md': 'text/markdown',
+    '.txt': 'text/markdown',
+    '.docx': 'document/word',
+    '.doc': 'document/word',
+})
+
+
+def _json_string(value: str) -> str:
+    """JSON string literal with non-ASCII characters left as-is"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _yaml_scalar(value) -> str:
+    """Render a scalar as YAML, quoting strings only when a plain scalar would be misread"""
+    if value is None:
+        return 'null'
+    if value is True:
+        return 'true'
+    if value is False:
+        return 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        if value != value:
+            return '.nan'
+        if value in (float('inf'), float('-inf')):
+            return '.inf' if value > 0 else '-.inf'
+        text = repr(value)
+        # YAML 1.1 floats need a dot before the exponent
+        if '.' not in text:
+            text = text.replace('e', '.0e')
+        return text
+    if isinstance(value, str):
+        if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_KEYWORDS:
+            return value
+        # JSON strings are valid YAML double-quoted scalars
+        quoted = _json_string(value)
+        return _YAML_UNSAFE_CHARS_RE.sub(lambda m: '\\u%04x' % ord(m.group()), quoted)
+    raise TypeError(f"Unsupported frontmatter value: {type(value).__name__}")
+
+
+def _emit_yaml_block(value, indent: int, lines: List[str]):
+    """Append block-style YAML lines for a non-empty dict or list"""
+    pad = ' ' * indent
+    if isinstance(value, dict):
+        for key, item in value.items():
+            key = _yaml_scalar(key)
+            if isinstance(item, dict) and item:
+                lines.append(f"{pad}{key}:")
+                _emit_yaml_block(item, indent + 2, lines)
+            elif isinstance(item, (list, tuple)) and item:
+                # Sequences under a key are not indented, as yaml.dump writes them
+                lines.append(f"{pad}{key}:")
+                _emit_yaml_block(item, indent, lines)
+            else:
+                lines.append(f"{pad}{key}: {_yaml_flow(item)}")
+    else:
+        for item in value:
+            if isinstance(item, (dict, list, tuple)) and item:
+                nested = []
+                _emit_yaml_block(item, indent + 2, nested)
+                nested[0] = f"{pad}- {nested[0][indent + 2:]}"
+                lines.extend(nested)
+            else:
+                lines.append(f"{pad}- {_yaml_flow(item)}")
+
+
+def _yaml_flow(value) -> str:
+    """Render a scalar or an empty collection inline"""
+    if isinstance(value, dict):
+        return '{}'
+    if isinstance(value, (list, tuple)):
+        return '[]'
+    return _yaml_scalar(value)
+
+
+def _emit_frontmatter(frontmatter: Dict) -> str:
+    """Emit frontmatter YAML directly; values are plain dicts, lists and scalars"""
+    lines = []
+    _emit_yaml_block(frontmatter, 0, lines)
+    return '\n'.join(lines)
+
+
+def _json_string_array(items: List[str]) -> str:
+    """JSON array of strings, skipping the encoder when no item needs escaping"""
+    if not items:
+        return '[]'
+    try:
+        body = '", "'.join(items)
+    except TypeError:
+        return json.dumps(items)
+    # Only separator quotes present and nothing that needs escaping
+    if body.isprintable() and '\\' not in body and body.count('"') == 2 * (len(items) - 1):
+        return f'["{body}"]'
+    return '[' + ', '.join(map(_json_string, items)) + ']'
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_file_size(size_bytes: int) -> str:
+    """Human-readable size, cached since each file's size is formatted more than once"""
+    if size_bytes == 0:
+        return "0 B"
+    
+    # Each unit is 10 bits wide, so the bit length picks the unit without a division loop
+    unit_index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    if unit_index <= 0:
+        return f"{size_bytes:.1f} B"
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_SIZE_UNITS[unit_index]}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _auto_tags(features: Tuple) -> Tuple[str, ...]:
+    """Tags for a feature tuple built by FloatDisGenerator.generate_auto_tags"""
+    (extension, is_conversation, is_export, has_ctx, has_highlights, has_dispatch,
+     high_signal, has_persona, has_platform, tripartite_domain, confidence_level,
+     complexity, high_priority, code_heavy, actionable, well_organized,
+     cross_ref, insights_level, size_index) = features
+    tags = ['float/dropzone', 'auto-generated']
+    
+    # File type tags
+    extension_tag = _EXTENSION_TAGS.get(extension)
+    if extension_tag:
+        tags.append(extension_tag)
+    
+    # Content type tags
+    if is_conversation:
+        tags.append('content/conversation')
+    if is_export:
+        tags.append('content/export')
+    
+    # FLOAT pattern tags
+    if has_ctx:
+        tags.append('float/ctx')
+    if has_highlights:
+        tags.append('float/highlight')
+    if has_dispatch:
+        tags.append('float/dispatch')
+    
+    # Enhanced FLOAT pattern tags
+    if high_signal:
+        tags.append('float/high-signal')
+    if has_persona:
+        tags.append('float/persona')
+    if has_platform:
+        tags.append('float/platform-integration')
+    
+    # Tripartite classification tags
+    if tripartite_domain:
+        tags.append(f'tripartite/{tripartite_domain}')
+    tags.append(_CONFIDENCE_TAGS[confidence_level])
+    
+    # Content complexity tags
+    tags.append(f'complexity/{complexity}')
+    
+    # Priority tags
+    if high_priority:
+        tags.append('priority/high')
+    
+    # Document structure tags
+    if code_heavy:
+        tags.append('content/code-heavy')
+    if actionable:
+        tags.append('content/actionable')
+    if well_organized:
+        tags.append('structure/well-organized')
+    
+    # Cross-reference potential tags
+    if cross_ref:
+        tags.append('cross-ref/potential')
+    
+    # Actionable insights tags
+    if insights_level > 0:
+        tags.append('insights/actionable')
+    if insights_level > 1:
+        tags.append('insights/rich')
+    
+    # Size tags
+    tags.append(_SIZE_TAGS[size_index])
+    
+    return tuple(tags)
+
+
+class _ExtractedAnalysis:
+    """Analysis fields read by both the frontmatter and the template, looked up once per file"""
+    
+    __slots__ = ('summary', 'word_count', 'line_count', 'has_ctx_markers', 'has_highlights',
+                 'has_float_dispatch', 'has_conversation_links', 'ctx_count', 'highlight_count',
+                 'signal_density', 'errors')
+    
+    def __init__(self, content_analysis: Dict):
+        get = content_analysis.get
+        self.summary = get('summary', 'No summary available')
+        self.word_count = get('word_count', 0)
+        self.line_count = get('line_count', 0)
+        self.has_ctx_markers = get('has_ctx_markers', False)
+        self.has_highlights = get('has_highlights', False)
+        self.has_float_dispatch = get('has_float_dispatch', False)
+        self.has_conversation_links = get('has_conversation_links', False)
+        self.ctx_count = get('ctx_count', 0)
+        self.highlight_count = get('highlight_count', 0)
+        self.signal_density = get('signal_density', 0.0)
+        self.errors = get('errors', [])
+
 
 class FloatDisGenerator:
     """
     Generates .float_dis.md files with rich metadata and clean static content.
     """
     
+    __slots__ = ('template_version',)
+    
     def __init__(self):
         self.template_version = "1.0"
         
@@ -22,35 +284,72 @@ class FloatDisGenerator:
         """
         Generate a complete .float_dis.md file with YAML frontmatter and static content.
         """
+        return ''.join(self._float_dis_parts(file_metadata, chroma_metadata, content_analysis, float_id))
+    
+    def write_float_dis(self, f: TextIO, file_metadata: Dict, chroma_metadata: Dict, 
+                        content_analysis: Dict, float_id: str):
+        """
+        Write a .float_dis.md file to an open text stream without joining it in memory first.
+        """
+        f.writelines(self._float_dis_parts(file_metadata, chroma_metadata, content_analysis, float_id))
+    
+    def _float_dis_parts(self, file_metadata: Dict, chroma_metadata: Dict, 
+                         content_analysis: Dict, float_id: str) -> List[str]:
+        """
+        Build the .dis file as ordered pieces: frontmatter fence, YAML, fence, template sections.
+        """
+        
+        # One timestamp for every generated/processed field in this file
+        now = datetime.now()
+        
+        # Fields shared by the frontmatter and the template
+        extracted = _ExtractedAnalysis(content_analysis)
         
         # Generate YAML frontmatter
-        frontmatter = self.generate_frontmatter(file_metadata, chroma_metadata, content_analysis, float_id)
+        frontmatter = self.generate_frontmatter(file_metadata, chroma_metadata, content_analysis, float_id, now,
+                                                extracted)
         
-        # Generate static template content
-        template_content = self.generate_template_content(file_metadata, chroma_metadata, content_analysis, float_id)
+        # Generate static template content as sections
+        template_sections = self.generate_template_sections(file_metadata, chroma_metadata, content_analysis, float_id,
+                                                            now, extracted)
         
-        # Combine into full .dis file
-        dis_content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False, sort_keys=False).strip()}
----
-
-{template_content}
-"""
+        # Fixed-shape frontmatter is emitted directly; yaml.dump covers anything unexpected
+        try:
+            frontmatter_yaml = _emit_frontmatter(frontmatter)
+        except TypeError:
+            frontmatter_yaml = yaml.dump(frontmatter, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False).strip()
         
-        return dis_content
+        return ['---\n', frontmatter_yaml, '\n---\n\n', *template_sections, '\n']
     
     def generate_frontmatter(self, file_metadata: Dict, chroma_metadata: Dict, 
-                           content_analysis: Dict, float_id: str) -> Dict:
+                           content_analysis: Dict, float_id: str, now: Optional[datetime] = None,
+                           extracted: Optional[_ExtractedAnalysis] = None) -> Dict:
         """
         Generate comprehensive YAML frontmatter for the .dis file.
         """
+        if now is None:
+            now = datetime.now()
+        now_iso = now.isoformat()
+        if extracted is None:
+            extracted = _ExtractedAnalysis(content_analysis)
+        
+        # Bound once: the analysis dict is read ~35 times below
+        get = content_analysis.get
+        
+        # Sections read repeatedly below
+        float_patterns = get('float_patterns', _EMPTY_MAPPING)
+        actionable_insights = get('actionable_insights', [])
+        if 'document_structure' in content_analysis:
+            document_structure = content_analysis['document_structure']
+        else:
+            document_structure = dict(_DEFAULT_DOCUMENT_STRUCTURE)
         
         frontmatter = {
             # Core FLOAT metadata
             'float_id': float_id,
             'float_type': 'dropzone_ingestion',
             'float_version': self.template_version,
-            'generated_at': datetime.now().isoformat(),
+            'generated_at': now_iso,
             
             # Original file metadata
             'original_file': {
@@ -67,8 +366,8 @@ class FloatDisGenerator:
             'timestamps': {
                 'file_created': file_metadata.get('created_at'),
                 'file_modified': file_metadata.get('modified_at'),
-                'processed_at': datetime.now().isoformat(),
-                'ingestion_date': datetime.now().strftime('%Y-%m-%d')
+                'processed_at': now_iso,
+                'ingestion_date': now.strftime('%Y-%m-%d')
             },
             
             # Chroma storage metadata
@@ -83,79 +382,72 @@ class FloatDisGenerator:
             
             # Content analysis
             'content': {
-                'summary': content_analysis.get('summary', 'No summary available'),
-                'word_count': content_analysis.get('word_count', 0),
-                'line_count': content_analysis.get('line_count', 0),
-                'content_type': content_analysis.get('content_type', 'Unknown'),
-                'detected_patterns': content_analysis.get('detected_patterns', []),
-                'language': content_analysis.get('language', 'unknown'),
-                'encoding': content_analysis.get('encoding', 'utf-8')
+                'summary': extracted.summary,
+                'word_count': extracted.word_count,
+                'line_count': extracted.line_count,
+                'content_type': get('content_type', 'Unknown'),
+                'detected_patterns': get('detected_patterns', []),
+                'language': get('language', 'unknown'),
+                'encoding': get('encoding', 'utf-8')
             },
             
             # FLOAT patterns (enhanced from pattern detector)
             'float_patterns': {
-                'has_ctx_markers': content_analysis.get('has_ctx_markers', False),
-                'has_highlights': content_analysis.get('has_highlights', False),
-                'has_float_dispatch': content_analysis.get('has_float_dispatch', False),
-                'has_conversation_links': content_analysis.get('has_conversation_links', False),
+                'has_ctx_markers': extracted.has_ctx_markers,
+                'has_highlights': extracted.has_highlights,
+                'has_float_dispatch': extracted.has_float_dispatch,
+                'has_conversation_links': extracted.has_conversation_links,
                 
                 # Enhanced patterns from tripartite chunker
-                'core_signals': content_analysis.get('float_patterns', {}).get('ctx_markers', 0) + 
-                              content_analysis.get('float_patterns', {}).get('highlight_markers', 0) + 
-                              content_analysis.get('float_patterns', {}).get('signal_markers', 0),
-                'extended_patterns': content_analysis.get('float_patterns', {}).get('expand_on', 0) + 
-                                   content_analysis.get('float_patterns', {}).get('relates_to', 0) + 
-                                   content_analysis.get('float_patterns', {}).get('remember_when', 0) + 
-                                   content_analysis.get('float_patterns', {}).get('story_time', 0),
-                'persona_annotations': content_analysis.get('persona_count', 0),
-                'dominant_persona': content_analysis.get('dominant_persona'),
-                'signal_density': content_analysis.get('signal_density', 0.0),
-                'has_high_signal_density': content_analysis.get('has_high_signal_density', False),
-                'ctx_count': content_analysis.get('ctx_count', 0),
-                'highlight_count': content_analysis.get('highlight_count', 0),
-                'signal_density': content_analysis.get('signal_density', 0.0)
+                'core_signals': float_patterns.get('ctx_markers', 0) + 
+                              float_patterns.get('highlight_markers', 0) + 
+                              float_patterns.get('signal_markers', 0),
+                'extended_patterns': float_patterns.get('expand_on', 0) + 
+                                   float_patterns.get('relates_to', 0) + 
+                                   float_patterns.get('remember_when', 0) + 
+                                   float_patterns.get('story_time', 0),
+                'persona_annotations': get('persona_count', 0),
+                'dominant_persona': get('dominant_persona'),
+                'signal_density': extracted.signal_density,
+                'has_high_signal_density': get('has_high_signal_density', False),
+                'ctx_count': extracted.ctx_count,
+                'highlight_count': extracted.highlight_count
             },
             
             # Tripartite classification (enhanced from pattern detector)
             'tripartite': {
-                'primary_domain': content_analysis.get('tripartite_domain', 'concept'),
-                'confidence': content_analysis.get('tripartite_confidence', 0.0),
-                'scores': content_analysis.get('tripartite_scores', {}),
-                'routing': content_analysis.get('tripartite_routing', []),
-                'content_complexity': content_analysis.get('content_complexity', 'medium'),
-                'is_high_priority': content_analysis.get('is_high_priority', False)
+                'primary_domain': get('tripartite_domain', 'concept'),
+                'confidence': get('tripartite_confidence', 0.0),
+                'scores': get('tripartite_scores', {}),
+                'routing': get('tripartite_routing', []),
+                'content_complexity': get('content_complexity', 'medium'),
+                'is_high_priority': get('is_high_priority', False)
             },
             
             # Platform integration analysis
             'platform_integration': {
-                'has_platform_refs': content_analysis.get('has_platform_integration', False),
-                'platform_count': content_analysis.get('platform_references', 0),
-                'build_tools': content_analysis.get('build_tool_references', []),
-                'external_services': content_analysis.get('external_service_references', [])
+                'has_platform_refs': get('has_platform_integration', False),
+                'platform_count': get('platform_references', 0),
+                'build_tools': get('build_tool_references', []),
+                'external_services': get('external_service_references', [])
             },
             
             # Document structure analysis
-            'document_structure': content_analysis.get('document_structure', {
-                'heading_count': 0,
-                'list_density': 0,
-                'code_density': 0.0,
-                'action_items': 0
-            }),
+            'document_structure': document_structure,
             
             # Cross-reference potential
             'cross_references': {
-                'score': content_analysis.get('cross_reference_score', 0.0),
-                'has_potential': content_analysis.get('has_cross_reference_potential', False),
-                'citation_count': content_analysis.get('citation_count', 0),
-                'link_count': content_analysis.get('link_count', 0)
+                'score': get('cross_reference_score', 0.0),
+                'has_potential': get('has_cross_reference_potential', False),
+                'citation_count': get('citation_count', 0),
+                'link_count': get('link_count', 0)
             },
             
             # Actionable insights
             'insights': {
-                'actionable_items': content_analysis.get('actionable_insights', []),
-                'priority_items': [item for item in content_analysis.get('actionable_insights', []) 
-                                 if item.get('priority') == 'high'],
-                'total_insights': len(content_analysis.get('actionable_insights', []))
+                'actionable_items': actionable_insights,
+                'priority_items': [item for item in actionable_insights if item.get('priority') == 'high'],
+                'total_insights': len(actionable_insights)
             },
             
             # Processing metadata
@@ -163,8 +455,8 @@ class FloatDisGenerator:
                 'daemon_version': '1.0',
                 'processing_method': 'automated_dropzone',
                 'chunking_strategy': chroma_metadata.get('chunking_strategy', 'content_aware'),
-                'content_extracted': content_analysis.get('extraction_successful', False),
-                'errors': content_analysis.get('errors', [])
+                'content_extracted': get('extraction_successful', False),
+                'errors': extracted.errors
             },
             
             # Obsidian integration
@@ -182,123 +474,79 @@ class FloatDisGenerator:
         """
         Generate automatic tags based on file and content analysis.
         """
-        tags = ['float/dropzone', 'auto-generated']
-        
-        # File type tags
-        extension = file_metadata['extension'].lower()
-        if extension in ['.json']:
-            tags.append('data/json')
-        elif extension in ['.pdf']:
-            tags.append('document/pdf')
-        elif extension in ['.md', '.txt']:
-            tags.append('text/markdown')
-        elif extension in ['.docx', '.doc']:
-            tags.append('document/word')
-        
-        # Content type tags
-        content_type = content_analysis.get('content_type', '').lower()
-        if 'conversation' in content_type or 'chat' in content_type:
-            tags.append('content/conversation')
-        if 'export' in content_type:
-            tags.append('content/export')
-        
-        # FLOAT pattern tags
-        if content_analysis.get('has_ctx_markers'):
-            tags.append('float/ctx')
-        if content_analysis.get('has_highlights'):
-            tags.append('float/highlight')
-        if content_analysis.get('has_float_dispatch'):
-            tags.append('float/dispatch')
+        get = content_analysis.get
+        content_type = get('content_type', '').lower()
         
-        # Enhanced FLOAT pattern tags
-        if content_analysis.get('has_high_signal_density'):
-            tags.append('float/high-signal')
-        if content_analysis.get('persona_count', 0) > 0:
-            tags.append('float/persona')
-        if content_analysis.get('has_platform_integration'):
-            tags.append('float/platform-integration')
-        
-        # Tripartite classification tags
-        tripartite_domain = content_analysis.get('tripartite_domain')
-        if tripartite_domain:
-            tags.append(f'tripartite/{tripartite_domain}')
-        
-        tripartite_confidence = content_analysis.get('tripartite_confidence', 0)
+        tripartite_confidence = get('tripartite_confidence', 0)
         if tripartite_confidence > 0.8:
-            tags.append('tripartite/high-confidence')
+            confidence_level = 2
         elif tripartite_confidence > 0.5:
-            tags.append('tripartite/medium-confidence')
-        else:
-            tags.append('tripartite/low-confidence')
-        
-        # Content complexity tags
-        complexity = content_analysis.get('content_complexity', 'medium')
-        tags.append(f'complexity/{complexity}')
-        
-        # Priority tags
-        if content_analysis.get('is_high_priority'):
-            tags.append('priority/high')
-        
-        # Document structure tags
-        doc_structure = content_analysis.get('document_structure', {})
-        if doc_structure.get('code_density', 0) > 0.1:
-            tags.append('content/code-heavy')
-        if doc_structure.get('action_items', 0) > 0:
-            tags.append('content/actionable')
-        if doc_structure.get('heading_count', 0) > 5:
-            tags.append('structure/well-organized')
-        
-        # Cross-reference potential tags
-        if content_analysis.get('has_cross_reference_potential'):
-            tags.append('cross-ref/potential')
-        
-        # Actionable insights tags
-        insights_count = len(content_analysis.get('actionable_insights', []))
-        if insights_count > 0:
-            tags.append('insights/actionable')
-        if insights_count > 3:
-            tags.append('insights/rich')
-        
-        # Size tags
-        size_bytes = file_metadata.get('size_bytes', 0)
-        if size_bytes < 1024 * 10:  # < 10KB
-            tags.append('size/tiny')
-        elif size_bytes < 1024 * 100:  # < 100KB
-            tags.append('size/small')
-        elif size_bytes < 1024 * 1024:  # < 1MB
-            tags.append('size/medium')
+            confidence_level = 1
         else:
-            tags.append('size/large')
-        
-        return tags
+            confidence_level = 0
+        
+        doc_structure = get('document_structure', _EMPTY_MAPPING)
+        insights_count = len(get('actionable_insights', ()))
+        
+        # Similar files share a feature tuple, so their tag lists are built once
+        features = (
+            file_metadata['extension'].lower(),
+            'conversation' in content_type or 'chat' in content_type,
+            'export' in content_type,
+            bool(get('has_ctx_markers')),
+            bool(get('has_highlights')),
+            bool(get('has_float_dispatch')),
+            bool(get('has_high_signal_density')),
+            get('persona_count', 0) > 0,
+            bool(get('has_platform_integration')),
+            get('tripartite_domain'),
+            confidence_level,
+            get('content_complexity', 'medium'),
+            bool(get('is_high_priority')),
+            doc_structure.get('code_density', 0) > 0.1,
+            doc_structure.get('action_items', 0) > 0,
+            doc_structure.get('heading_count', 0) > 5,
+            bool(get('has_cross_reference_potential')),
+            (insights_count > 0) + (insights_count > 3),
+            bisect.bisect_right(_SIZE_TAG_LIMITS, file_metadata.get('size_bytes', 0)),
+        )
+        return list(_auto_tags(features))
     
     def generate_template_content(self, file_metadata: Dict, chroma_metadata: Dict, 
-                                content_analysis: Dict, float_id: str) -> str:
+                                content_analysis: Dict, float_id: str, now: Optional[datetime] = None,
+                                extracted: Optional[_ExtractedAnalysis] = None) -> str:
         """
         Generate clean static content for rich Obsidian display.
         """
-        
-        # Calculate human-readable file size and extract values
-        size_bytes = file_metadata.get('size_bytes', 0)
-        size_human = self.format_file_size(size_bytes)
-        
-        # Pre-compute values for clean template generation
-        has_ctx_markers = content_analysis.get('has_ctx_markers', False)
-        has_highlights = content_analysis.get('has_highlights', False)
-        has_float_dispatch = content_analysis.get('has_float_dispatch', False)
-        has_conversation_links = content_analysis.get('has_conversation_links', False)
-        
-        ctx_count = content_analysis.get('ctx_count', 0)
-        highlight_count = content_analysis.get('highlight_count', 0)
-        error_count = len(content_analysis.get('errors', []))
-        
+        return ''.join(self.generate_template_sections(file_metadata, chroma_metadata, content_analysis, float_id, now,
+                                                       extracted))
+    
+    def generate_template_sections(self, file_metadata: Dict, chroma_metadata: Dict, 
+                                   content_analysis: Dict, float_id: str, now: Optional[datetime] = None,
+                                   extracted: Optional[_ExtractedAnalysis] = None) -> List[str]:
+        """
+        Generate the template content as consecutive sections, ready for writelines.
+        """
+        if now is None:
+            now = datetime.now()
+        if extracted is None:
+            extracted = _ExtractedAnalysis(content_analysis)
+        generated_at = now.strftime("%Y-%m-%d %H:%M:%S")
         chunk_ids = chroma_metadata.get('chunk_ids', [])
         
-        # Safe content type handling
-        content_type_words = content_analysis.get('content_type', 'content').split()
-        first_content_type = content_type_words[0] if content_type_words else 'content'
+        return [
+            self._section_overview(file_metadata, float_id, generated_at),
+            self._section_content_analysis(content_analysis, extracted),
+            self._section_chroma_storage(chroma_metadata, content_analysis, float_id, chunk_ids),
+            self._section_processing(chroma_metadata, content_analysis, extracted),
+            self._section_actions(file_metadata, float_id, chunk_ids, generated_at),
+        ]
+    
+    def _section_overview(self, file_metadata: Dict, float_id: str, generated_at: str) -> str:
+        """Title, template banner and file overview table"""
+        size_human = self.format_file_size(file_metadata.get('size_bytes', 0))
         
-        content = f"""# 🗂️ FLOAT Dropzone Index: {file_metadata['filename']}
+        return f"""# 🗂️ FLOAT Dropzone Index: {file_metadata['filename']}
 
 ```js
 // FLOAT Display Template - Auto-generated
@@ -314,16 +562,20 @@ class FloatDisGenerator:
 | **File Type** | {file_metadata.get('file_type', 'Unknown')} |
 | **Size** | {size_human} |
 | **Float ID** | `{float_id}` |
-| **Processed** | {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} |
+| **Processed** | {generated_at} |
 
-## 🧠 Content Analysis
+"""
+    
+    def _section_content_analysis(self, content_analysis: Dict, extracted: _ExtractedAnalysis) -> str:
+        """Summary, content metrics and FLOAT pattern table"""
+        return f"""## 🧠 Content Analysis
 
 ### Summary
-{content_analysis.get('summary', 'No summary available')}
+{extracted.summary}
 
 ### Content Metrics
-- **Words**: {content_analysis.get('word_count', 0):,}
-- **Lines**: {content_analysis.get('line_count', 0):,}
+- **Words**: {extracted.word_count:,}
+- **Lines**: {extracted.line_count:,}
 - **Content Type**: {content_analysis.get('content_type', 'Unknown')}
 - **Language**: {content_analysis.get('language', 'Unknown')}
 
@@ -331,14 +583,23 @@ class FloatDisGenerator:
 
 | Pattern | Detected | Count |
 |---------|----------|-------|
-| **ctx::** | {"✅" if has_ctx_markers else "❌"} | {ctx_count} |
-| **highlight::** | {"✅" if has_highlights else "❌"} | {highlight_count} |
-| **float.dispatch** | {"✅" if has_float_dispatch else "❌"} | N/A |
-| **Conversation Links** | {"✅" if has_conversation_links else "❌"} | N/A |
+| **ctx::** | {"✅" if extracted.has_ctx_markers else "❌"} | {extracted.ctx_count} |
+| **highlight::** | {"✅" if extracted.has_highlights else "❌"} | {extracted.highlight_count} |
+| **float.dispatch** | {"✅" if extracted.has_float_dispatch else "❌"} | N/A |
+| **Conversation Links** | {"✅" if extracted.has_conversation_links else "❌"} | N/A |
 
-**Signal Density**: {content_analysis.get('signal_density', 0.0):.2%}
+**Signal Density**: {extracted.signal_density:.2%}
 
-## 💾 Chroma Storage
+"""
+    
+    def _section_chroma_storage(self, chroma_metadata: Dict, content_analysis: Dict, float_id: str,
+                                chunk_ids: List[str]) -> str:
+        """Chroma collection details, chunk index and search snippets"""
+        # Safe content type handling
+        content_type_words = content_analysis.get('content_type', 'content').split()
+        first_content_type = content_type_words[0] if content_type_words else 'content'
+        
+        return f"""## 💾 Chroma Storage
 
 ### Collection Details
 - **Collection**: `{chroma_metadata.get('collection_name', 'unknown')}`
@@ -373,7 +634,16 @@ SORT file.mtime DESC
 LIMIT 5
 ```
 
-## 📊 Processing Details
+"""
+    
+    def _section_processing(self, chroma_metadata: Dict, content_analysis: Dict,
+                            extracted: _ExtractedAnalysis) -> str:
+        """Extraction results and any processing errors"""
+        errors = extracted.errors or ()
+        error_count = len(errors)
+        error_block = ('### Processing Errors\n' + '\n'.join(f"- {error}" for error in errors)) if errors else ""
+        
+        return f"""## 📊 Processing Details
 
 ### Extraction Results
 - **Method**: Automated dropzone processing
@@ -381,10 +651,13 @@ LIMIT 5
 - **Chunking**: {chroma_metadata.get('chunking_strategy', 'content_aware')}
 - **Errors**: {error_count}
 
-{f'''### Processing Errors
-{chr(10).join([f"- {error}" for error in content_analysis.get('errors', [])])}''' if error_count > 0 else ""}
+{error_block}
 
-## 🔗 Actions
+"""
+    
+    def _section_actions(self, file_metadata: Dict, float_id: str, chunk_ids: List[str], generated_at: str) -> str:
+        """Quick actions, export snippet, Templater block and footer"""
+        return f"""## 🔗 Actions
 
 ### Quick Actions
 - [[{file_metadata['filename']}|📄 View Original File]]
@@ -398,7 +671,7 @@ LIMIT 5
 const exportData = {{
     floatId: "{float_id}",
     filename: "{file_metadata['filename']}",
-    chunks: {json.dumps(chunk_ids)}
+    chunks: {_json_string_array(chunk_ids)}
 }};
 
 // Copy to clipboard
@@ -438,33 +711,26 @@ if (typeof tp !== 'undefined') {{
 <div style="background: #f0f0f0; padding: 10px; border-radius: 5px; margin-top: 20px;">
 <small>
 🤖 <strong>Auto-generated by FLOAT Dropzone Daemon v1.0</strong><br>
-📅 Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}<br>
+📅 Generated: {generated_at}<br>
 🔄 Auto-update: Enabled<br>
 📍 Float ID: <code>{float_id}</code>
 </small>
 </div>
 """
-        
-        return content
     
     def format_file_size(self, size_bytes: int) -> str:
         """
         Convert bytes to human readable format.
         """
-        if size_bytes == 0:
-            return "0 B"
-        
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        
-        return f"{size_bytes:.1f} TB"
+        return _format_file_size(size_bytes)
     
     def create_float_dis_file(self, file_path: Path, file_metadata: Dict, chroma_metadata: Dict, 
-                             content_analysis: Dict, float_id: str) -> Path:
+                             content_analysis: Dict, float_id: str, force: bool = False) -> Path:
         """
         Create the .float_dis.md file in the same directory as the source file.
+        
+        An existing .dis file generated from the same source (mtime, size, float ID)
+        and the same metadata and analysis is left as-is unless force is set.
         """
         
         # Generate .dis filename
@@ -472,48 +738,42 @@ if (typeof tp !== 'undefined') {{
         dis_filename = f"{base_name}.float_dis.md"
         dis_path = file_path.parent / dis_filename
         
-        # Generate content
-        dis_content = self.generate_float_dis(file_metadata, chroma_metadata, content_analysis, float_id)
+        cache_key = self._dis_cache_key(file_path, file_metadata, chroma_metadata, content_analysis, float_id)
+        if not force and cache_key is not None and self._read_dis_cache_key(dis_path) == cache_key:
+            return dis_path
         
-        # Write file
-        with open(dis_path, 'w', encoding='utf-8') as f:
-            f.write(dis_content)
+        parts = self._float_dis_parts(file_metadata, chroma_metadata, content_analysis, float_id)
+        if cache_key is not None:
+            parts.insert(1, f"{_CACHE_KEY_PREFIX}{cache_key}\n")
+        
+        # Write file piece by piece; the large buffer lets a whole .dis file go out in one write
+        with open(dis_path, 'w', encoding='utf-8', buffering=DIS_WRITE_BUFFER_SIZE) as f:
+            f.writelines(parts)
         
         return dis_path
-
-if __name__ == "__main__":
-    # Test the fixed generator
-    print("Fixed FLOAT .dis generator test")
-    
-    # Sample data for testing
-    sample_file_metadata = {
-        'filename': 'test.json',
-        'extension': '.json',
-        'size_bytes': 1024,
-        'file_type': 'JSON file',
-        'created_at': '2025-06-09T12:00:00',
-        'modified_at': '2025-06-09T12:00:00'
-    }
-    
-    sample_chroma_metadata = {
-        'collection_name': 'test_collection',
-        'chunk_count': 1,
-        'chunk_ids': ['test_chunk_1']
-    }
-    
-    sample_content_analysis = {
-        'summary': 'Test file',
-        'word_count': 100,
-        'has_ctx_markers': True,
-        'ctx_count': 5
-    }
-    
-    generator = FloatDisGenerator()
-    result = generator.generate_float_dis(
-        sample_file_metadata, 
-        sample_chroma_metadata, 
-        sample_content_analysis, 
-        'test_float_id'
-    )
-    
-    print("✅ Generated sample .dis content successfully")
\ No newline at end of file
+    
+    def _dis_cache_key(self, file_path: Path, file_metadata: Dict, chroma_metadata: Dict,
+                       content_analysis: Dict, float_id: str) -> Optional[str]:
+        """Key identifying the source state and inputs a .dis file is generated from, None if the source is gone"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        source = f"{stat.st_mtime_ns}:{stat.st_size}:{float_id}:{self.template_version}"
+        inputs = json.dumps([file_metadata, chroma_metadata, content_analysis], sort_keys=True, default=str)
+        key = hashlib.blake2b(source.encode('utf-8'), digest_size=16)
+        key.update(inputs.encode('utf-8'))
+        return key.hexdigest()
+    
+    @staticmethod
+    def _read_dis_cache_key(dis_path: Path) -> Optional[str]:
+        """Cache key recorded in an existing .dis file, if any"""
+        try:
+            with open(dis_path, 'rb') as f:
+                head = f.read(_CACHE_KEY_LINE_LENGTH).decode('utf-8', 'ignore')
+        except OSError:
+            return None
+        lines = head.split('\n', 2)
+        if len(lines) < 3 or lines[0] != '---' or not lines[1].startswith(_CACHE_KEY_PREFIX):
+            return None
+        return lines[1][len(_CACHE_KEY_PREFIX):]
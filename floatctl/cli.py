@@ -6,15 +6,52 @@ Exposes lf1m daemon functionality as CLI commands.
 """
 
 import click
+import importlib
 import json
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
-from floatctl.core.lf1m import LF1M
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 
-@click.group()
+def _dumps(obj: Any) -> str:
+    """Indented JSON for --output json, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode('utf-8')
+    return json.dumps(obj, indent=2, default=str)
+
+
+class LazyGroup(click.Group):
+    """Click group that imports registered subcommands only when they are invoked"""
+    
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+    
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+    
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._load_lazy_command(cmd_name)
+        return super().get_command(ctx, cmd_name)
+    
+    def _load_lazy_command(self, cmd_name):
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(':')
+        module = importlib.import_module(module_name)
+        return getattr(module, attribute)
+
+
+# FloatQL parsing and LF1M itself are imported on first use so `floatctl --help` stays fast
+@click.group(cls=LazyGroup, lazy_subcommands={'query': 'floatctl.commands.search:query'})
 @click.option('--config', '-c', help='Path to config file')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
 @click.pass_context
@@ -26,16 +63,30 @@ def cli(ctx, config, verbose):
     """
     # Store config in context
     ctx.ensure_object(dict)
+    if ctx.obj.get('config_path') != config:
+        # A cached LF1M only serves the config it was built from
+        ctx.obj.pop('lf1m', None)
     ctx.obj['config_path'] = config
     ctx.obj['verbose'] = verbose
 
 
+def _get_lf1m(ctx):
+    """LF1M for this CLI context, built on first use and reused by later commands"""
+    lf1m = ctx.obj.get('lf1m')
+    if lf1m is None:
+        from floatctl.core.lf1m import LF1M
+        lf1m = ctx.obj['lf1m'] = LF1M(config_path=ctx.obj.get('config_path'))
+    return lf1m
+
+
 @cli.command()
 @click.argument('target', type=click.Path(exists=True))
 @click.option('--recursive', '-r', is_flag=True, help='Process folders recursively')
 @click.option('--output', '-o', help='Output format: json, summary, detailed', default='summary')
+@click.option('--parallel', '-p', default=1, type=click.IntRange(min=1),
+              help='Number of files to process concurrently in a folder')
 @click.pass_context
-def process(ctx, target, recursive, output):
+def process(ctx, target, recursive, output, parallel):
     """Process file or folder through FLOAT pipeline
     
     TARGET can be a file or folder path.
@@ -43,12 +94,12 @@ def process(ctx, target, recursive, output):
     Examples:
       floatctl process ./chat-export.md
       floatctl process ./exports/ --recursive
+      floatctl process ./exports/ --recursive --parallel 4
     """
     target_path = Path(target)
     
     try:
-        # Initialize LF1M
-        lf1m = LF1M(config_path=ctx.obj.get('config_path'))
+        lf1m = _get_lf1m(ctx)
         
         if target_path.is_file():
             click.echo(f"Processing file: {target_path.name}")
@@ -57,7 +108,7 @@ def process(ctx, target, recursive, output):
             
         elif target_path.is_dir():
             click.echo(f"Processing folder: {target_path.name} (recursive: {recursive})")
-            results = lf1m.process_folder(target_path, recursive=recursive)
+            results = lf1m.iter_process_folder(target_path, recursive=recursive, parallel=parallel)
             _display_process_results(results, output)
             
         else:
@@ -89,7 +140,7 @@ def search(ctx, query, collections, limit, output):
       floatctl search "meeting notes" --limit 5
     """
     try:
-        lf1m = LF1M(config_path=ctx.obj.get('config_path'))
+        lf1m = _get_lf1m(ctx)
         
         # Parse collections list
         collection_list = None
@@ -111,11 +162,6 @@ def search(ctx, query, collections, limit, output):
         sys.exit(1)
 
 
-# Import and add the enhanced query command
-from floatctl.commands.search import query as query_command
-cli.add_command(query_command)
-
-
 @cli.group()
 def daemon():
     """Daemon control commands"""
@@ -127,7 +173,7 @@ def daemon():
 def status(ctx):
     """Show daemon status and processing statistics"""
     try:
-        lf1m = LF1M(config_path=ctx.obj.get('config_path'))
+        lf1m = _get_lf1m(ctx)
         status_info = lf1m.get_daemon_status()
         
         click.echo("=== lf1m Daemon Status ===")
@@ -144,7 +190,7 @@ def status(ctx):
             
         if ctx.obj.get('verbose') and status_info.get('status') != 'stopped':
             click.echo("\n=== Raw Status ===")
-            click.echo(json.dumps(status_info, indent=2))
+            click.echo(_dumps(status_info))
             
     except Exception as e:
         click.echo(f"Error getting daemon status: {e}", err=True)
@@ -172,7 +218,7 @@ def stop(ctx):
 def collections(ctx):
     """List ChromaDB collections and document counts"""
     try:
-        lf1m = LF1M(config_path=ctx.obj.get('config_path'))
+        lf1m = _get_lf1m(ctx)
         collections_info = lf1m.list_collections()
         
         click.echo("=== ChromaDB Collections ===")
@@ -205,7 +251,7 @@ def reprocess(ctx, dropzone_only):
 def _display_process_result(result: dict, output_format: str):
     """Display single file processing result"""
     if output_format == 'json':
-        click.echo(json.dumps(result, indent=2))
+        click.echo(_dumps(result))
     elif output_format == 'detailed':
         click.echo(f"Success: {result.get('success', False)}")
         if result.get('success'):
@@ -224,57 +270,74 @@ def _display_process_result(result: dict, output_format: str):
             click.echo(f"✗ Failed - {result.get('error', 'Unknown error')}")
 
 
-def _display_process_results(results: List[dict], output_format: str):
-    """Display multiple file processing results"""
+def _display_process_results(results: Iterable[dict], output_format: str):
+    """Display multiple file processing results as they arrive"""
     if output_format == 'json':
-        click.echo(json.dumps(results, indent=2))
+        _echo_json_array(results)
         return
     
-    successful = sum(1 for r in results if r.get('success'))
-    total = len(results)
+    successful = 0
+    total = 0
+    shown_failed_header = False
     
-    click.echo(f"\nProcessed {successful}/{total} files successfully")
-    
-    if output_format == 'detailed':
-        for result in results:
+    for result in results:
+        total += 1
+        if result.get('success'):
+            successful += 1
+        
+        if output_format == 'detailed':
             click.echo(f"\n{result.get('file_path', 'Unknown file')}:")
             _display_process_result(result, 'detailed')
-    else:  # summary
-        failed = [r for r in results if not r.get('success')]
-        if failed:
-            click.echo("\nFailed files:")
-            for result in failed:
-                click.echo(f"  ✗ {Path(result.get('file_path', 'Unknown')).name}: {result.get('error', 'Unknown error')}")
+        elif not result.get('success'):  # summary
+            if not shown_failed_header:
+                click.echo("\nFailed files:")
+                shown_failed_header = True
+            click.echo(f"  ✗ {Path(result.get('file_path', 'Unknown')).name}: {result.get('error', 'Unknown error')}")
+    
+    click.echo(f"\nProcessed {successful}/{total} files successfully")
+
+
+def _echo_json_array(items: Iterable[Any]):
+    """Echo items as one indented JSON array, writing each item as soon as it arrives"""
+    first = True
+    for item in items:
+        # Re-indent the item's own lines one level to nest it inside the array
+        click.echo(('[\n  ' if first else ',\n  ') + _dumps(item).replace('\n', '\n  '), nl=False)
+        first = False
+    click.echo('[]' if first else '\n]')
 
 
 def _display_search_results(results: List[dict], output_format: str):
     """Display search results"""
     if output_format == 'json':
-        click.echo(json.dumps(results, indent=2))
+        click.echo(_dumps(results))
         return
     
     if not results:
         click.echo("No results found.")
         return
     
-    click.echo(f"\nFound {len(results)} results:")
+    # Collect every line and echo once rather than writing per field
+    lines = [f"\nFound {len(results)} results:"]
     
     for i, result in enumerate(results, 1):
-        click.echo(f"\n{i}. Collection: {result['collection']}")
+        lines.append(f"\n{i}. Collection: {result['collection']}")
         
         if output_format == 'detailed':
-            click.echo(f"   ID: {result.get('id', 'N/A')}")
-            click.echo(f"   Distance: {result.get('distance', 'N/A')}")
+            lines.append(f"   ID: {result.get('id', 'N/A')}")
+            lines.append(f"   Distance: {result.get('distance', 'N/A')}")
             if result.get('metadata'):
-                click.echo(f"   Metadata: {json.dumps(result['metadata'], indent=6)}")
-            click.echo(f"   Content: {result['document'][:200]}...")
+                lines.append(f"   Metadata: {json.dumps(result['metadata'], indent=6)}")
+            lines.append(f"   Content: {result['document'][:200]}...")
         else:  # summary
             # Extract title or first line of content
             content = result['document']
-            first_line = content.split('\n')[0] if content else "No content"
+            first_line = content.split('\n', 1)[0] if content else "No content"
             if len(first_line) > 80:
                 first_line = first_line[:77] + "..."
-            click.echo(f"   {first_line}")
+            lines.append(f"   {first_line}")
+    
+    click.echo('\n'.join(lines))
 
 
 if __name__ == '__main__':
@@ -5,33 +5,38 @@ Provides both basic text search and advanced FloatQL pattern search.
 """
 
 import click
+import heapq
 import json
-from typing import List, Dict, Any
-from floatctl.floatql.parser import FloatQLParser
+from typing import Any, Dict, Iterator, List, Optional
+from floatctl.floatql.parser import FloatQLParser, get_parser
 from floatctl.floatql.translator import QueryTranslator
 
 
-def search_with_floatql(lf1m, query: str, collections: List[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+def search_with_floatql(lf1m, query: str, collections: List[str] = None, limit: int = 10,
+                        parsed: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Enhanced search that detects and processes FloatQL syntax
     
     Falls back to basic search if no FloatQL patterns detected.
+    Pass `parsed` when the query has already been parsed to skip parsing it again.
     """
-    parser = FloatQLParser()
+    parser = get_parser()
     
     # Check if this is a FloatQL query
     if parser.is_floatql_query(query):
-        return _execute_floatql_search(lf1m, parser, query, collections, limit)
+        return _execute_floatql_search(lf1m, parser, query, collections, limit, parsed)
     else:
         # Basic text search
         return lf1m.search_collections(query, collections, limit)
 
 
-def _execute_floatql_search(lf1m, parser: FloatQLParser, query: str, collections: List[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+def _execute_floatql_search(lf1m, parser: FloatQLParser, query: str, collections: List[str] = None, limit: int = 10,
+                            parsed: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """Execute FloatQL-aware search"""
     
-    # Parse the query
-    parsed = parser.parse(query)
+    # Parse the query unless the caller already did
+    if parsed is None:
+        parsed = parser.parse(query)
     
     # Get suggested collections if none specified
     if collections is None:
@@ -42,51 +47,22 @@ def _execute_floatql_search(lf1m, parser: FloatQLParser, query: str, collections
     chroma_query = translator.translate_to_chroma_query(parsed)
     
     # Execute search with metadata filters
-    results = []
-    
     try:
-        import chromadb
-        client = chromadb.PersistentClient(path=lf1m.chroma_data_path)
+        # Build query parameters
+        query_params = {
+            'query_texts': chroma_query['query_texts'],
+            'n_results': limit
+        }
         
-        for collection_name in collections:
-            try:
-                collection = client.get_collection(collection_name)
-                
-                # Build query parameters
-                query_params = {
-                    'query_texts': chroma_query['query_texts'],
-                    'n_results': limit
-                }
-                
-                # Add metadata filters if present
-                if chroma_query['where']:
-                    query_params['where'] = chroma_query['where']
-                
-                # Execute query
-                search_results = collection.query(**query_params)
-                
-                # Format results
-                for i, doc in enumerate(search_results['documents'][0]):
-                    results.append({
-                        'collection': collection_name,
-                        'document': doc,
-                        'metadata': search_results['metadatas'][0][i] if search_results['metadatas'][0] else {},
-                        'distance': search_results['distances'][0][i] if search_results['distances'][0] else None,
-                        'id': search_results['ids'][0][i] if search_results['ids'][0] else None,
-                        'floatql_match': _analyze_floatql_match(doc, parsed)
-                    })
-                    
-            except Exception as e:
-                lf1m.logger.warning(f"Error searching collection {collection_name}: {e}")
-                continue
+        # Add metadata filters if present
+        if chroma_query['where']:
+            query_params['where'] = chroma_query['where']
         
-        # Sort by FloatQL relevance, then by distance
-        results.sort(key=lambda x: (
-            -x['floatql_match']['score'],  # Higher FloatQL scores first
-            x['distance'] or float('inf')   # Then by similarity distance
-        ))
+        # Execute query against every collection at once
+        responses = lf1m.query_collections(collections, **query_params)
         
-        return results[:limit]
+        # Keep only the best `limit` results instead of sorting them all
+        return heapq.nsmallest(limit, _iter_floatql_results(responses, parsed), key=_floatql_rank)
         
     except Exception as e:
         lf1m.logger.error(f"FloatQL search error: {e}")
@@ -95,39 +71,76 @@ def _execute_floatql_search(lf1m, parser: FloatQLParser, query: str, collections
         return lf1m.search_collections(basic_query, collections, limit)
 
 
-def _analyze_floatql_match(document: str, parsed: Dict[str, Any]) -> Dict[str, Any]:
+def _iter_floatql_results(responses, parsed: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Format (collection_name, chroma results) pairs into scored FloatQL results"""
+    needles = _FloatQLNeedles(parsed)
+    for collection_name, search_results in responses:
+        # Missing columns fall back to empty metadata / None
+        documents = search_results['documents'][0]
+        for doc, metadata, distance, doc_id in zip(
+            documents,
+            search_results['metadatas'][0] or [{} for _ in documents],
+            search_results['distances'][0] or [None] * len(documents),
+            search_results['ids'][0] or [None] * len(documents)
+        ):
+            yield {
+                'collection': collection_name,
+                'document': doc,
+                'metadata': metadata,
+                'distance': distance,
+                'id': doc_id,
+                'floatql_match': _analyze_floatql_match(doc, needles)
+            }
+
+
+def _floatql_rank(result: Dict[str, Any]):
+    """Sort key: higher FloatQL scores first, then by similarity distance"""
+    return (-result['floatql_match']['score'], result['distance'] or float('inf'))
+
+
+class _FloatQLNeedles:
+    """Substrings and scores for one parsed query, built once and reused for every result"""
+    
+    __slots__ = ('exact', 'text', 'total_patterns')
+    
+    def __init__(self, parsed: Dict[str, Any]):
+        # (needle, score, match label), checked case-sensitively in this order
+        self.exact = (
+            # FLOAT pattern matches
+            [(f"{pattern}::", 10, f"float:{pattern}") for pattern in parsed['float_patterns']] +
+            # Persona pattern matches
+            [(f"[{pattern}::]", 8, f"persona:{pattern}") for pattern in parsed['persona_patterns']] +
+            # Bridge ID matches - bridge matches are very important
+            [(bridge_id, 15, f"bridge:{bridge_id}") for bridge_id in parsed['bridge_ids']]
+        )
+        # (lowercased term, match label), checked against the lowercased document
+        self.text = [(term.lower(), f"text:{term}") for term in parsed['text_terms']]
+        self.total_patterns = len(self.exact)
+
+
+def _analyze_floatql_match(document: str, needles: _FloatQLNeedles) -> Dict[str, Any]:
     """Analyze how well a document matches FloatQL patterns"""
     score = 0
     matches = []
     
-    # Score FLOAT pattern matches
-    for pattern in parsed['float_patterns']:
-        if f"{pattern}::" in document:
-            score += 10
-            matches.append(f"float:{pattern}")
-    
-    # Score persona pattern matches
-    for pattern in parsed['persona_patterns']:
-        if f"[{pattern}::]" in document:
-            score += 8
-            matches.append(f"persona:{pattern}")
+    # Score FLOAT pattern, persona and bridge ID matches
+    for needle, needle_score, label in needles.exact:
+        if needle in document:
+            score += needle_score
+            matches.append(label)
     
-    # Score bridge ID matches
-    for bridge_id in parsed['bridge_ids']:
-        if bridge_id in document:
-            score += 15  # Bridge matches are very important
-            matches.append(f"bridge:{bridge_id}")
-    
-    # Score text term matches
-    for term in parsed['text_terms']:
-        if term.lower() in document.lower():
-            score += 1
-            matches.append(f"text:{term}")
+    # Score text term matches, lowercasing the document once rather than per term
+    if needles.text:
+        document_lower = document.lower()
+        for term_lower, label in needles.text:
+            if term_lower in document_lower:
+                score += 1
+                matches.append(label)
     
     return {
         'score': score,
         'matches': matches,
-        'total_patterns': len(parsed['float_patterns'] + parsed['persona_patterns'] + parsed['bridge_ids'])
+        'total_patterns': needles.total_patterns
     }
 
 
@@ -137,8 +150,9 @@ def _analyze_floatql_match(document: str, parsed: Dict[str, Any]) -> Dict[str, A
 @click.option('--limit', '-l', default=10, help='Maximum number of results')
 @click.option('--floatql-only', is_flag=True, help='Force FloatQL parsing even for simple queries')
 @click.option('--explain', is_flag=True, help='Show how the query was parsed and executed')
+@click.option('--no-cache', is_flag=True, help='Ignore results cached from an identical recent query')
 @click.pass_context
-def query(ctx, query, collections, limit, floatql_only, explain):
+def query(ctx, query, collections, limit, floatql_only, explain, no_cache):
     """Advanced search with FloatQL pattern support
     
     Supports FLOAT :: notation patterns:
@@ -177,10 +191,10 @@ def query(ctx, query, collections, limit, floatql_only, explain):
       floatctl query "bridge::CB-20250611-1510-N1CK --follow"
       floatctl query "redux:: created:today"
     """
-    from floatctl.core.lf1m import LF1M
+    from floatctl.cli import _get_lf1m
     
     try:
-        lf1m = LF1M(config_path=ctx.obj.get('config_path'))
+        lf1m = _get_lf1m(ctx)
         
         # Parse collections list
         collection_list = None
@@ -189,10 +203,13 @@ def query(ctx, query, collections, limit, floatql_only, explain):
         
         click.echo(f"Searching for: '{query}'")
         
+        # Parse once; the explain output and the FloatQL search share the result
+        parser = get_parser()
+        is_floatql = parser.is_floatql_query(query)
+        parsed = parser.parse(query) if (is_floatql or explain or floatql_only) else None
+        
         # Show parsing if explain mode
         if explain or floatql_only:
-            parser = FloatQLParser()
-            parsed = parser.parse(query)
             click.echo(f"\nParsed query:")
             click.echo(f"  Text terms: {parsed['text_terms']}")
             click.echo(f"  FLOAT patterns: {parsed['float_patterns']}")
@@ -205,11 +222,17 @@ def query(ctx, query, collections, limit, floatql_only, explain):
                 click.echo(f"  Suggested collections: {suggested}")
             click.echo()
         
-        # Execute search
-        if floatql_only or FloatQLParser().is_floatql_query(query):
-            results = search_with_floatql(lf1m, query, collection_list, limit)
+        # Execute search; without FloatQL syntax, even --floatql-only falls back to basic search
+        def run_search():
+            if is_floatql:
+                return _execute_floatql_search(lf1m, parser, query, collection_list, limit, parsed)
+            return lf1m.search_collections(query, collection_list, limit)
+        
+        if no_cache:
+            results = run_search()
         else:
-            results = lf1m.search_collections(query, collection_list, limit)
+            cache_key = ('query', query, tuple(collection_list or ()), limit)
+            results = lf1m.cached_search(cache_key, run_search)
         
         # Display results
         _display_query_results(results, explain)
@@ -5,17 +5,45 @@ Extracted from streamlined_float_daemon.py for CLI and daemon use.
 Handles file processing, search operations, and ChromaDB interactions.
 """
 
+import hashlib
+import heapq
 import os
 import sys
+import threading
 import time
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 # Add the parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 
+# Recent search results, kept next to the Chroma database so repeat CLI queries can reuse them
+SEARCH_CACHE_FILE = '.floatctl_search_cache.json'
+SEARCH_CACHE_MAX_ENTRIES = 64
+# Chroma's SQLite files; any write to the database changes their size or mtime
+CHROMA_DB_FILES = ('chroma.sqlite3', 'chroma.sqlite3-wal')
+
+
+def _embedding_function_key(embedding_function) -> Optional[Tuple]:
+    """Identity of a Chroma embedding function by type and config, None if it can't be told apart"""
+    if embedding_function is None:
+        return None
+    try:
+        config = json.dumps(embedding_function.get_config(), sort_keys=True, default=str)
+        return (type(embedding_function), embedding_function.name(), config)
+    except Exception:
+        return None
+
+
 class LF1M:
     """Core FLOAT processing engine extracted from daemon"""
     
@@ -36,6 +64,14 @@ class LF1M:
         self.vault_path = Path(self.config.get('vault_path'))
         self.chroma_data_path = self.config.get('chroma_data_path')
         
+        # ChromaDB handles, opened on first search and reused afterwards
+        self._chroma_client = None
+        self._collection_cache = {}
+        
+        # Serializes pipeline steps that touch shared state (collections, today's daily summary)
+        # when a folder is processed with parallel > 1
+        self._pipeline_lock = threading.Lock()
+        
         # Initialize components
         self.components = self._initialize_components()
         
@@ -99,7 +135,10 @@ class LF1M:
         """
         file_path = Path(file_path)
         
-        if not file_path.exists():
+        # One stat serves as the existence check and, on the basic path, the file metadata
+        try:
+            file_stat = file_path.stat()
+        except OSError:
             return {
                 'success': False,
                 'error': 'File not found',
@@ -110,7 +149,10 @@ class LF1M:
             self.logger.info(f"Processing file: {file_path.name}")
             
             if self.enhanced_integration:
-                result = self.enhanced_integration.process_file_with_enhanced_integration(file_path)
+                # The enhanced pipeline stores chunks and rebuilds today's daily summary, so it
+                # runs one file at a time
+                with self._pipeline_lock:
+                    result = self.enhanced_integration.process_file_with_enhanced_integration(file_path)
                 # Enhanced integration returns a different format, standardize it
                 if isinstance(result, dict):
                     result['success'] = True
@@ -122,11 +164,13 @@ class LF1M:
                         'processed_at': datetime.now().isoformat()
                     }
             else:
-                result = self._process_file_basic(file_path)
+                result = self._process_file_basic(file_path, file_stat)
                 result['success'] = True
                 result['processed_at'] = datetime.now().isoformat()
             
             self.logger.info(f"Successfully processed: {file_path.name}")
+            # New content can change any search, so cached results are stale
+            self.clear_search_cache()
             return result
             
         except Exception as e:
@@ -137,26 +181,65 @@ class LF1M:
                 'file_path': str(file_path)
             }
     
-    def process_folder(self, folder_path: Union[str, Path], recursive: bool = True) -> List[Dict[str, Any]]:
+    def process_folder(self, folder_path: Union[str, Path], recursive: bool = True,
+                       parallel: int = 1) -> List[Dict[str, Any]]:
         """Process all files in a folder"""
+        return list(self.iter_process_folder(folder_path, recursive=recursive, parallel=parallel))
+    
+    def iter_process_folder(self, folder_path: Union[str, Path], recursive: bool = True,
+                            parallel: int = 1) -> Iterator[Dict[str, Any]]:
+        """
+        Process all files in a folder, yielding each result as soon as it is ready.
+        With parallel > 1, files are processed on a thread pool so reading, hashing and
+        .dis rendering overlap; ChromaDB storage and the enhanced pipeline still run one
+        file at a time. Results keep the folder's file order either way.
+        """
         folder_path = Path(folder_path)
         
         if not folder_path.exists() or not folder_path.is_dir():
-            return [{
+            yield {
                 'success': False,
                 'error': 'Folder not found or not a directory',
                 'folder_path': str(folder_path)
-            }]
+            }
+            return
         
-        results = []
-        pattern = "**/*" if recursive else "*"
+        file_paths = self._iter_folder_files(folder_path, recursive)
         
-        for file_path in folder_path.glob(pattern):
-            if file_path.is_file() and not self._should_skip_file(file_path):
-                result = self.process_file(file_path)
-                results.append(result)
+        if parallel > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                yield from executor.map(self.process_file, file_paths)
+        else:
+            for file_path in file_paths:
+                yield self.process_file(file_path)
+    
+    def _iter_folder_files(self, folder_path: Path, recursive: bool) -> Iterator[Path]:
+        """
+        Files to process under a folder, each directory's files before its subfolders.
+        Uses os.scandir so file/dir checks come from the directory listing rather than
+        a stat per path; like pathlib's glob, symlinked folders are not descended into.
+        """
+        try:
+            with os.scandir(folder_path) as scandir_it:
+                entries = list(scandir_it)
+        except PermissionError:
+            return
         
-        return results
+        subfolders = []
+        for entry in entries:
+            try:
+                if entry.is_file():
+                    file_path = folder_path / entry.name
+                    if not self._should_skip_file(file_path):
+                        yield file_path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    subfolders.append(folder_path / entry.name)
+            except OSError:
+                continue
+        
+        for subfolder in subfolders:
+            yield from self._iter_folder_files(subfolder, recursive)
     
     def search_collections(self, query: str, collections: List[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -164,9 +247,6 @@ class LF1M:
         Basic text search - FloatQL parsing handled in commands/search.py
         """
         try:
-            import chromadb
-            client = chromadb.PersistentClient(path=self.chroma_data_path)
-            
             if collections is None:
                 # Default collections to search
                 collections = [
@@ -178,42 +258,205 @@ class LF1M:
             
             all_results = []
             
-            for collection_name in collections:
-                try:
-                    collection = client.get_collection(collection_name)
-                    results = collection.query(
-                        query_texts=[query],
-                        n_results=limit
+            for collection_name, results in self.query_collections(collections, query_texts=[query], n_results=limit):
+                # Format results; missing columns fall back to empty metadata / None
+                documents = results['documents'][0]
+                all_results.extend(
+                    {
+                        'collection': collection_name,
+                        'document': doc,
+                        'metadata': metadata,
+                        'distance': distance,
+                        'id': doc_id
+                    }
+                    for doc, metadata, distance, doc_id in zip(
+                        documents,
+                        results['metadatas'][0] or [{} for _ in documents],
+                        results['distances'][0] or [None] * len(documents),
+                        results['ids'][0] or [None] * len(documents)
                     )
-                    
-                    # Format results
-                    for i, doc in enumerate(results['documents'][0]):
-                        all_results.append({
-                            'collection': collection_name,
-                            'document': doc,
-                            'metadata': results['metadatas'][0][i] if results['metadatas'][0] else {},
-                            'distance': results['distances'][0][i] if results['distances'][0] else None,
-                            'id': results['ids'][0][i] if results['ids'][0] else None
-                        })
-                        
-                except Exception as e:
-                    self.logger.warning(f"Error searching collection {collection_name}: {e}")
-                    continue
-            
-            # Sort by distance (similarity)
-            all_results.sort(key=lambda x: x['distance'] or float('inf'))
+                )
             
-            return all_results[:limit]
+            # Closest `limit` results by distance (similarity); nsmallest keeps sort order for ties
+            return heapq.nsmallest(limit, all_results, key=lambda x: x['distance'] or float('inf'))
             
         except Exception as e:
             self.logger.error(f"Search error: {e}")
             return []
     
+    def cached_search(self, key: Tuple, search: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Return results for an identical recent search, or run search() and remember them.
+        
+        Results are stored in a file under chroma_data_path so later floatctl runs can reuse
+        them. Entries expire after search_cache_ttl seconds and are ignored once the Chroma
+        database changes. `key` must be JSON-serializable.
+        """
+        ttl = self.config.get('search_cache_ttl', 300)
+        if not ttl or ttl <= 0 or not self.chroma_data_path:
+            return search()
+        
+        cache_path = Path(self.chroma_data_path) / SEARCH_CACHE_FILE
+        entry_key = hashlib.blake2b(json.dumps(key).encode('utf-8'), digest_size=16).hexdigest()
+        db_stamp = self._chroma_db_stamp()
+        now = time.time()
+        
+        entries = {
+            k: entry for k, entry in self._read_search_cache(cache_path).items()
+            if entry.get('expires_at', 0) > now and entry.get('db_stamp') == db_stamp
+        }
+        if entry_key in entries:
+            return entries[entry_key]['results']
+        
+        results = search()
+        if not results:
+            # Empty results may come from a failed search, so they are not kept
+            return results
+        
+        entries[entry_key] = {'expires_at': now + ttl, 'db_stamp': db_stamp, 'results': results}
+        if len(entries) > SEARCH_CACHE_MAX_ENTRIES:
+            newest = sorted(entries, key=lambda k: entries[k]['expires_at'])[-SEARCH_CACHE_MAX_ENTRIES:]
+            entries = {k: entries[k] for k in newest}
+        self._write_search_cache(cache_path, entries)
+        return results
+    
+    def clear_search_cache(self):
+        """Forget all cached search results"""
+        if self.chroma_data_path:
+            try:
+                (Path(self.chroma_data_path) / SEARCH_CACHE_FILE).unlink()
+            except OSError:
+                pass
+    
+    def _chroma_db_stamp(self) -> List[List]:
+        """Size and mtime of Chroma's database files, to tell whether cached results are stale"""
+        stamp = []
+        for name in CHROMA_DB_FILES:
+            try:
+                stat = os.stat(os.path.join(self.chroma_data_path, name))
+            except OSError:
+                continue
+            stamp.append([name, stat.st_size, stat.st_mtime_ns])
+        return stamp
+    
+    def _read_search_cache(self, cache_path: Path) -> Dict[str, Dict[str, Any]]:
+        """Cached search entries, or none if the cache file is missing or unreadable"""
+        try:
+            if ORJSON_AVAILABLE:
+                entries = orjson.loads(cache_path.read_bytes())
+            else:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+    
+    def _write_search_cache(self, cache_path: Path, entries: Dict[str, Dict[str, Any]]):
+        """Replace the cache file atomically; caching is best-effort, so failures are only logged"""
+        temp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            if ORJSON_AVAILABLE:
+                temp_path.write_bytes(orjson.dumps(entries))
+            else:
+                temp_path.write_text(json.dumps(entries), encoding='utf-8')
+            os.replace(temp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.debug(f"Could not write search cache: {e}")
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+    
+    def get_chroma_client(self):
+        """Persistent ChromaDB client, opened once per LF1M instance"""
+        if self._chroma_client is None:
+            import chromadb
+            self._chroma_client = chromadb.PersistentClient(path=self.chroma_data_path)
+        return self._chroma_client
+    
+    def _get_collection(self, collection_name: str):
+        """Collection handle, fetched from the client once and then reused"""
+        collection = self._collection_cache.get(collection_name)
+        if collection is None:
+            collection = self.get_chroma_client().get_collection(collection_name)
+            self._collection_cache[collection_name] = collection
+        return collection
+    
+    def query_collections(self, collection_names: List[str], **query_params) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Run the same query against several collections concurrently.
+        Returns (collection_name, results) pairs in collection order; collections
+        that fail are logged and left out.
+        """
+        collections = []
+        for collection_name in collection_names:
+            try:
+                collections.append((collection_name, self._get_collection(collection_name)))
+            except Exception as e:
+                self.logger.warning(f"Error searching collection {collection_name}: {e}")
+        
+        params_by_name = self._share_query_embeddings(collections, query_params)
+        
+        def query_one(item):
+            collection_name, collection = item
+            try:
+                return collection_name, collection.query(**params_by_name[collection_name])
+            except Exception as e:
+                # The collection may have been dropped or recreated; fetch it afresh next time
+                self._collection_cache.pop(collection_name, None)
+                self.logger.warning(f"Error searching collection {collection_name}: {e}")
+                return collection_name, None
+        
+        if len(collections) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+            # Chroma releases the GIL in its SQLite/index calls, so collections are searched side by side
+            with ThreadPoolExecutor(max_workers=len(collections)) as executor:
+                responses = list(executor.map(query_one, collections))
+        else:
+            responses = [query_one(item) for item in collections]
+        
+        return [(name, results) for name, results in responses if results is not None]
+    
+    def _share_query_embeddings(self, collections: List[Tuple[str, Any]],
+                                query_params: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-collection query parameters with query_texts embedded once per embedding function.
+        Collections sharing an embedding function reuse the same query_embeddings instead of
+        each re-encoding the texts; anything that can't be embedded up front keeps query_texts.
+        """
+        query_texts = query_params.get('query_texts')
+        if not query_texts or len(collections) < 2:
+            return {collection_name: query_params for collection_name, _ in collections}
+        
+        base_params = {key: value for key, value in query_params.items() if key != 'query_texts'}
+        embeddings_by_function = {}
+        params_by_name = {}
+        
+        for collection_name, collection in collections:
+            embedding_function = getattr(collection, '_embedding_function', None)
+            key = _embedding_function_key(embedding_function)
+            if key is not None and key not in embeddings_by_function:
+                try:
+                    embeddings_by_function[key] = embedding_function(query_texts)
+                except Exception as e:
+                    self.logger.warning(f"Could not embed query for {collection_name}: {e}")
+                    embeddings_by_function[key] = None
+            
+            query_embeddings = embeddings_by_function.get(key)
+            if query_embeddings is None:
+                params_by_name[collection_name] = query_params
+            else:
+                params_by_name[collection_name] = dict(base_params, query_embeddings=query_embeddings)
+        
+        return params_by_name
+    
     def get_daemon_status(self) -> Dict[str, Any]:
         """Get status of the lf1m daemon if running"""
         try:
             status_file = self.dropzone_path / '.daemon_status.json'
             if status_file.exists():
+                if ORJSON_AVAILABLE:
+                    return orjson.loads(status_file.read_bytes())
                 with open(status_file, 'r') as f:
                     status = json.load(f)
                 return status
@@ -225,11 +468,8 @@ class LF1M:
     def list_collections(self) -> List[Dict[str, Any]]:
         """List all ChromaDB collections with counts"""
         try:
-            import chromadb
-            client = chromadb.PersistentClient(path=self.chroma_data_path)
-            
             collections = []
-            for collection in client.list_collections():
+            for collection in self.get_chroma_client().list_collections():
                 collections.append({
                     'name': collection.name,
                     'count': collection.count()
@@ -241,10 +481,10 @@ class LF1M:
             self.logger.error(f"Error listing collections: {e}")
             return []
     
-    def _process_file_basic(self, file_path: Path) -> Dict[str, Any]:
+    def _process_file_basic(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Basic file processing without enhanced integration"""
         # Extract content and metadata
-        file_metadata = self._extract_file_metadata(file_path)
+        file_metadata = self._extract_file_metadata(file_path, file_stat)
         content = self._extract_file_content(file_path, file_metadata)
         
         # Generate float ID
@@ -259,7 +499,8 @@ class LF1M:
         }
         
         # Store in ChromaDB
-        storage_result = self._store_in_comprehensive_collections(file_analysis)
+        with self._pipeline_lock:
+            storage_result = self._store_in_comprehensive_collections(file_analysis)
         
         # Generate .dis file
         dis_file_path = self._generate_dis_file(file_path, file_analysis, storage_result)
@@ -279,9 +520,10 @@ class LF1M:
             'Unconfirmed' in file_path.name
         )
     
-    def _extract_file_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Extract basic file metadata"""
-        stat = file_path.stat()
+    def _extract_file_metadata(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Extract basic file metadata, reusing a stat result the caller already has"""
+        if stat is None:
+            stat = file_path.stat()
         return {
             'file_name': file_path.name,
             'file_path': str(file_path),
@@ -317,21 +559,25 @@ class LF1M:
         if len(content) <= chunk_size:
             return [content]
         
-        # Try paragraph chunking first
-        paragraphs = content.split('\n\n')
+        # Try paragraph chunking first. Paragraphs are contiguous in content, so a chunk
+        # is tracked as offsets and sliced out once instead of being rebuilt by appends.
         chunks = []
-        current_chunk = ""
+        chunk_start = 0
+        chunk_length = 0  # length of the chunk so far, counting a '\n\n' after each paragraph
+        offset = 0
         
-        for paragraph in paragraphs:
-            if len(current_chunk + paragraph) <= chunk_size:
-                current_chunk += paragraph + '\n\n'
+        for paragraph in content.split('\n\n'):
+            if chunk_length + len(paragraph) <= chunk_size:
+                chunk_length += len(paragraph) + 2
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = paragraph + '\n\n'
+                if chunk_length:
+                    chunks.append(content[chunk_start:offset].strip())
+                chunk_start = offset
+                chunk_length = len(paragraph) + 2
+            offset += len(paragraph) + 2
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if chunk_length:
+            chunks.append(content[chunk_start:offset].strip())
         
         return chunks
     
@@ -4,7 +4,7 @@ FloatQL - Query language for FLOAT :: notation
 Parses natural :: notation into ChromaDB/filesystem queries.
 """
 
-from .parser import FloatQLParser
+from .parser import FloatQLParser, get_parser
 from .translator import QueryTranslator
 
-__all__ = ['FloatQLParser', 'QueryTranslator']
\ No newline at end of file
+__all__ = ['FloatQLParser', 'QueryTranslator', 'get_parser']
\ No newline at end of file
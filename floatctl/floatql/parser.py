@@ -9,25 +9,36 @@ Handles patterns like:
 - [sysop::] or [karen::]
 """
 
+import functools
 import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
 
+# Patterns are compiled once at import and shared by every parser
+
+# FLOAT pattern regex - matches pattern:: or [pattern::]
+_FLOAT_PATTERN_RE = re.compile(r'(?:\[(\w+)::\]|(\w+)::)')
+
+# Temporal patterns - created:, modified:, date:
+_TEMPORAL_RE = re.compile(r'(created|modified|date):(\w+)')
+
+# Bridge pattern - CB-YYYYMMDD-HHMM-XXXX
+_BRIDGE_RE = re.compile(r'bridge::(CB-\d{8}-\d{4}-\w+)')
+
+# Type pattern - type:log, type:conversation
+_TYPE_RE = re.compile(r'type:(\w+)')
+
+# Any FloatQL syntax: :: notation (including bridge::) or a field filter
+_FLOATQL_SYNTAX_RE = re.compile(r'::|(?:created|modified|date|type):')
+
+
 class FloatQLParser:
     """Parser for FloatQL syntax - converts :: notation to structured queries"""
     
-    def __init__(self):
-        # FLOAT pattern regex - matches pattern:: or [pattern::]
-        self.float_pattern_re = re.compile(r'(?:\[(\w+)::\]|(\w+)::)')
-        
-        # Temporal patterns - created:, modified:, date:
-        self.temporal_re = re.compile(r'(created|modified|date):(\w+)')
-        
-        # Bridge pattern - CB-YYYYMMDD-HHMM-XXXX
-        self.bridge_re = re.compile(r'bridge::(CB-\d{8}-\d{4}-\w+)')
-        
-        # Type pattern - type:log, type:conversation
-        self.type_re = re.compile(r'type:(\w+)')
+    float_pattern_re = _FLOAT_PATTERN_RE
+    temporal_re = _TEMPORAL_RE
+    bridge_re = _BRIDGE_RE
+    type_re = _TYPE_RE
     
     def parse(self, query: str) -> Dict[str, Any]:
         """
@@ -157,11 +168,7 @@ class FloatQLParser:
     
     def is_floatql_query(self, query: str) -> bool:
         """Check if query contains FloatQL syntax"""
-        return (
-            '::' in query or 
-            re.search(r'(created|modified|date|type):', query) or
-            re.search(r'bridge::', query)
-        )
+        return _FLOATQL_SYNTAX_RE.search(query) is not None
     
     def extract_search_terms(self, parsed: Dict[str, Any]) -> str:
         """Extract just the text search terms for basic search"""
@@ -197,4 +204,10 @@ class FloatQLParser:
                 'float_tripartite_v2_metaphor'
             ])
         
-        return list(set(collections))  # Remove duplicates
\ No newline at end of file
+        return list(set(collections))  # Remove duplicates
+
+
+@functools.lru_cache(maxsize=1)
+def get_parser() -> FloatQLParser:
+    """Shared parser; FloatQLParser keeps no per-query state"""
+    return FloatQLParser()
@@ -13,6 +13,13 @@ from pathlib import Path
 from typing import Dict, Optional, List, Any
 import psutil
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 class HealthMonitor:
     """Monitor daemon health and provide comprehensive status information"""
     
@@ -407,7 +414,8 @@ class HealthMonitor:
             
             quarantined_files = list(quarantine_folder.glob('*'))
             # Filter out error logs
-            actual_files = [f for f in quarantined_files if not f.name.endswith('.error.json') and not f.name.endswith('.error.txt')]
+            actual_files = [f for f in quarantined_files
+                            if not f.name.endswith(('.error.json', '.error.txt', '.error.traceback.txt'))]
             
             count = len(actual_files)
             
@@ -490,6 +498,9 @@ class HealthMonitor:
         """Write comprehensive status to file for external monitoring"""
         try:
             status = self.get_status()
+            if ORJSON_AVAILABLE:
+                self.status_file.write_bytes(orjson.dumps(status, option=orjson.OPT_INDENT_2))
+                return
             with open(self.status_file, 'w', encoding='utf-8') as f:
                 json.dump(status, f, indent=2)
         except Exception as e:
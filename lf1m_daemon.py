@@ -18,6 +18,7 @@ Responsibilities:
 """
 
 import os
+import re
 import time
 from datetime import datetime
 from pathlib import Path
@@ -25,6 +26,12 @@ from typing import Dict, List, Optional
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from storage_utils import JSON_START_RE, add_chunks
+
+# Characters of content encoded per sha256 update when deriving float IDs
+HASH_SLICE_CHARS = 1024 * 1024
+
+
 class LF1MDaemon(FileSystemEventHandler):
     """
     Little Fucker (One Minute) - The Boundary Guardian
@@ -248,9 +255,15 @@ class LF1MDaemon(FileSystemEventHandler):
         
         start_time = time.time()
         
+        # One stat per file, shared by the dedup key and metadata extraction
+        try:
+            file_stat = file_path.stat()
+        except OSError:
+            file_stat = None
+        
         # Step 0: Check if file was already processed (unless force flag is set)
         if not self.force_reprocessing:
-            existing_float_id = self._is_file_processed(file_path)
+            existing_float_id = self._is_file_processed(file_path, file_stat)
             if existing_float_id:
                 self.logger.info(f"File already processed, skipping", 
                                extra={'file_name': file_path.name, 'float_id': existing_float_id, 'event': 'duplicate_skipped'})
@@ -261,7 +274,7 @@ class LF1MDaemon(FileSystemEventHandler):
                 }
         
         # Step 1: Extract content first for content-based float ID
-        file_metadata = self._extract_file_metadata(file_path)
+        file_metadata = self._extract_file_metadata(file_path, file_stat)
         content = self._extract_file_content(file_path, file_metadata)
         
         # Step 2: Generate content-based float ID
@@ -277,7 +290,7 @@ class LF1MDaemon(FileSystemEventHandler):
             ]
             
             if self._check_content_exists(float_id, all_collections):
-                self._mark_file_processed(file_path, float_id)
+                self._mark_file_processed(file_path, float_id, file_stat)
                 return {
                     'float_id': float_id,
                     'duplicate_skipped': True,
@@ -371,7 +384,7 @@ class LF1MDaemon(FileSystemEventHandler):
             )
             
             # Mark file as processed for future deduplication
-            self._mark_file_processed(file_path, float_id)
+            self._mark_file_processed(file_path, float_id, file_stat)
             
             return {
                 'float_id': float_id,
@@ -405,15 +418,24 @@ class LF1MDaemon(FileSystemEventHandler):
         """Generate content-based float ID to prevent duplicates."""
         import hashlib
         
-        # Use content hash as primary ID component
+        # Use content hash as primary ID component (sha256 kept so existing IDs still deduplicate)
         if content:
-            content_hash = hashlib.sha256(content.encode('utf-8')).hexdigest()[:12]
+            # Encode in slices: same digest as hashing content.encode() without a full-size bytes copy
+            hasher = hashlib.sha256()
+            for start in range(0, len(content), HASH_SLICE_CHARS):
+                hasher.update(content[start:start + HASH_SLICE_CHARS].encode('utf-8'))
+            content_hash = hasher.hexdigest()[:12]
         else:
-            # Fallback to file content if available
+            # Fallback to file content if available, streamed rather than read whole
             try:
                 with open(file_path, 'rb') as f:
-                    file_content = f.read()
-                content_hash = hashlib.sha256(file_content).hexdigest()[:12]
+                    if hasattr(hashlib, 'file_digest'):
+                        hasher = hashlib.file_digest(f, 'sha256')
+                    else:
+                        hasher = hashlib.sha256()
+                        for block in iter(lambda: f.read(1024 * 1024), b''):
+                            hasher.update(block)
+                content_hash = hasher.hexdigest()[:12]
             except:
                 # Last resort: use file path + size
                 stat = file_path.stat()
@@ -463,9 +485,15 @@ class LF1MDaemon(FileSystemEventHandler):
         except Exception as e:
             self.logger.warning(f"Failed to save processing state: {e}")
     
-    def _mark_file_processed(self, file_path: Path, float_id: str):
+    def _processing_state_key(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> str:
+        """Deduplication key from name, size and mtime (stats the file if no result is given)."""
+        if file_stat is None:
+            file_stat = file_path.stat()
+        return f"{file_path.name}_{file_stat.st_size}_{file_stat.st_mtime}"
+    
+    def _mark_file_processed(self, file_path: Path, float_id: str, file_stat: Optional[os.stat_result] = None):
         """Mark file as processed."""
-        file_key = f"{file_path.name}_{file_path.stat().st_size}_{file_path.stat().st_mtime}"
+        file_key = self._processing_state_key(file_path, file_stat)
         self.processed_files[file_key] = {
             'float_id': float_id,
             'processed_at': datetime.now().isoformat(),
@@ -473,10 +501,10 @@ class LF1MDaemon(FileSystemEventHandler):
         }
         self._save_processing_state()
     
-    def _is_file_processed(self, file_path: Path) -> Optional[str]:
+    def _is_file_processed(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> Optional[str]:
         """Check if file was already processed."""
         try:
-            file_key = f"{file_path.name}_{file_path.stat().st_size}_{file_path.stat().st_mtime}"
+            file_key = self._processing_state_key(file_path, file_stat)
             if file_key in self.processed_files:
                 return self.processed_files[file_key]['float_id']
             return None
@@ -508,8 +536,8 @@ class LF1MDaemon(FileSystemEventHandler):
             'processed_at': datetime.now().isoformat()
         }
     
-    def _extract_file_metadata(self, file_path: Path) -> Dict:
-        """Extract basic file metadata."""
+    def _extract_file_metadata(self, file_path: Path, file_stat: Optional[os.stat_result] = None) -> Dict:
+        """Extract basic file metadata (reusing a stat result when the caller has one)."""
         try:
             # Optional import for magic
             try:
@@ -534,7 +562,7 @@ class LF1MDaemon(FileSystemEventHandler):
                 mime_type = mime_types.get(extension, 'application/octet-stream')
                 file_type = f"{extension[1:].upper() if extension else 'Unknown'} file"
             
-            stat = file_path.stat()
+            stat = file_stat if file_stat is not None else file_path.stat()
             
             return {
                 'filename': file_path.name,
@@ -648,8 +676,6 @@ class LF1MDaemon(FileSystemEventHandler):
     
     def _sanitize_content(self, content: str) -> str:
         """Sanitize content by removing problematic inline data like base64 images."""
-        import re
-        
         if not content:
             return content
         
@@ -708,8 +734,6 @@ class LF1MDaemon(FileSystemEventHandler):
         if not content:
             return {'analysis_failed': True, 'reason': 'No content to analyze'}
         
-        import re
-        
         lines = content.split('\n')
         words = content.split()
         
@@ -720,29 +744,29 @@ class LF1MDaemon(FileSystemEventHandler):
             'char_count': len(content),
         }
         
-        # Simple content type detection
-        content_lower = content.lower()
+        # Simple content type detection (no whole-content copies: lower()/strip() allocate per call)
         if '"powered_by": "Claude Exporter' in content:
             analysis['content_type'] = "AI conversation export (Chrome plugin)"
         elif '"powered_by": "ChatGPT Exporter' in content:
             analysis['content_type'] = "AI conversation export (Chrome plugin)"
-        elif content.strip().startswith('{') or content.strip().startswith('['):
+        elif JSON_START_RE.match(content):
             analysis['content_type'] = "JSON data structure"
-        elif len([line for line in lines if line.startswith('#')]) > 3:
+        elif sum(1 for line in lines if line.startswith('#')) > 3:
             analysis['content_type'] = "Markdown document"
         else:
             analysis['content_type'] = file_metadata.get('file_type', 'Unknown content')
         
         # Basic FLOAT pattern detection (enhanced version handled by integration)
-        ctx_matches = re.findall(r'ctx::', content)
-        highlight_matches = re.findall(r'highlight::', content)
+        # Markers are plain literals, so str.count beats any regex scan
+        ctx_count = content.count('ctx::')
+        highlight_count = content.count('highlight::')
         
         analysis.update({
-            'has_ctx_markers': len(ctx_matches) > 0,
-            'has_highlights': len(highlight_matches) > 0,
-            'ctx_count': len(ctx_matches),
-            'highlight_count': len(highlight_matches),
-            'signal_density': (len(ctx_matches) + len(highlight_matches)) / max(len(words), 1)
+            'has_ctx_markers': ctx_count > 0,
+            'has_highlights': highlight_count > 0,
+            'ctx_count': ctx_count,
+            'highlight_count': highlight_count,
+            'signal_density': (ctx_count + highlight_count) / max(len(words), 1)
         })
         
         # Generate basic summary
@@ -805,8 +829,9 @@ class LF1MDaemon(FileSystemEventHandler):
         else:
             chunks = [content] if content else [f"Metadata-only entry for {file_analysis['metadata']['filename']}"]
         
-        # Store chunks
+        # Store chunks, all in one batch
         chunk_ids = []
+        chunk_metadatas = []
         for i, chunk in enumerate(chunks):
             chunk_id = f"{file_analysis['float_id']}_chunk_{i}"
             chunk_ids.append(chunk_id)
@@ -824,12 +849,9 @@ class LF1MDaemon(FileSystemEventHandler):
                 'signal_count': (file_analysis['analysis'].get('ctx_count', 0) + 
                                file_analysis['analysis'].get('highlight_count', 0))
             }
-            
-            dropzone_collection.add(
-                documents=[chunk],
-                metadatas=[chunk_metadata],
-                ids=[chunk_id]
-            )
+            chunk_metadatas.append(chunk_metadata)
+        
+        add_chunks(dropzone_collection, chunks, chunk_metadatas, chunk_ids)
         
         return {
             'success': True,
@@ -844,21 +866,25 @@ class LF1MDaemon(FileSystemEventHandler):
         if len(content) <= chunk_size:
             return [content]
         
-        # Try paragraph chunking first
-        paragraphs = content.split('\n\n')
+        # Try paragraph chunking first. Paragraphs are contiguous in content, so a chunk
+        # is tracked as offsets and sliced out once instead of being rebuilt by appends.
         chunks = []
-        current_chunk = ""
+        chunk_start = 0
+        chunk_length = 0  # length of the chunk so far, counting a '\n\n' after each paragraph
+        offset = 0
         
-        for paragraph in paragraphs:
-            if len(current_chunk + paragraph) <= chunk_size:
-                current_chunk += paragraph + '\n\n'
+        for paragraph in content.split('\n\n'):
+            if chunk_length + len(paragraph) <= chunk_size:
+                chunk_length += len(paragraph) + 2
             else:
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
-                current_chunk = paragraph + '\n\n'
+                if chunk_length:
+                    chunks.append(content[chunk_start:offset].strip())
+                chunk_start = offset
+                chunk_length = len(paragraph) + 2
+            offset += len(paragraph) + 2
         
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if chunk_length:
+            chunks.append(content[chunk_start:offset].strip())
         
         return chunks
     
@@ -930,7 +956,8 @@ class LF1MDaemon(FileSystemEventHandler):
                 file_analysis['metadata'],
                 chroma_metadata,
                 file_analysis['analysis'],
-                file_analysis['float_id']
+                file_analysis['float_id'],
+                force=self.force_reprocessing
             )
     
     def _update_daily_context_for_today(self):
@@ -0,0 +1,21 @@
+"""
+Storage helpers shared by the lf1m daemon and enhanced integration
+Kept free of optional dependencies so either module can import them
+"""
+
+import re
+from typing import Dict, List
+
+# Content whose first non-whitespace character opens a JSON object or array
+JSON_START_RE = re.compile(r'\s*[{\[]')
+
+# Chunks sent per collection.add call; each call is one embedding pass and one
+# SQLite transaction, and Chroma rejects batches beyond a few thousand records
+CHROMA_ADD_BATCH_SIZE = 1000
+
+
+def add_chunks(collection, documents: List[str], metadatas: List[Dict], ids: List[str]):
+    """Add a file's chunks in as few collection.add calls as Chroma's batch limit allows"""
+    for start in range(0, len(ids), CHROMA_ADD_BATCH_SIZE):
+        end = start + CHROMA_ADD_BATCH_SIZE
+        collection.add(documents=documents[start:end], metadatas=metadatas[start:end], ids=ids[start:end])
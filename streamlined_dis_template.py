@@ -9,6 +9,12 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+# Use the libyaml-backed emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
 class StreamlinedFloatDisGenerator:
     """
     Generates focused .float_dis.md files with essential metadata only.
@@ -37,7 +43,7 @@ class StreamlinedFloatDisGenerator:
         
         # Combine into streamlined .dis file
         dis_content = f"""---
-{yaml.dump(frontmatter, default_flow_style=False, sort_keys=False).strip()}
+{yaml.dump(frontmatter, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False).strip()}
 ---
 
 {template_content}
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Test suite for FLOAT error recovery
+Tests retry, quarantine and housekeeping behaviour of FileProcessingRecovery
+"""
+
+import json
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+import error_recovery
+from error_recovery import FileProcessingRecovery
+
+
+@pytest.fixture
+def recovery(temp_dir):
+    """Recovery system rooted in a temporary dropzone"""
+    return FileProcessingRecovery(temp_dir, max_retries=2)
+
+
+@pytest.fixture
+def sample_file(temp_dir):
+    """A small file sitting in the dropzone"""
+    file_path = temp_dir / "sample.md"
+    file_path.write_text("ctx:: sample content")
+    return file_path
+
+
+@pytest.mark.unit
+class TestFileProcessingRecovery:
+    """Test suite for FileProcessingRecovery"""
+
+    def test_successful_processing_returns_result(self, recovery, sample_file):
+        """Processor results pass straight through"""
+        result = recovery.process_with_recovery(sample_file, lambda path: {'success': True, 'path': str(path)})
+
+        assert result == {'success': True, 'path': str(sample_file)}
+
+    def test_memory_error_quarantines_with_file_size(self, recovery, sample_file):
+        """Memory errors quarantine the file and record its size"""
+        def processor(path):
+            raise MemoryError("too big")
+
+        result = recovery.process_with_recovery(sample_file, processor)
+
+        assert result['error'] == 'memory_error'
+        assert result['quarantined'] is True
+        quarantine_path = Path(result['quarantine_path'])
+        assert quarantine_path.exists()
+        assert not sample_file.exists()
+
+        error_log = quarantine_path.with_suffix(quarantine_path.suffix + '.error.json')
+        error_info = json.loads(error_log.read_text())
+        assert error_info['details']['file_size'] == len("ctx:: sample content")
+
+    def test_quarantine_summary_counts_files_and_error_types(self, recovery, temp_dir):
+        """Summary counts quarantined files separately from their error logs"""
+        for name in ("a.md", "b.md"):
+            file_path = temp_dir / name
+            file_path.write_text("content")
+            recovery._quarantine_file(file_path, "test reason", {'error_type': 'test_error', 'error_message': 'boom'})
+
+        summary = recovery.get_quarantine_summary()
+
+        assert summary['total_quarantined'] == 2
+        assert summary['by_error_type'] == {'test_error': 2}
+        assert len(summary['recent_errors']) == 2
+
+    def test_quarantine_summary_counts_hidden_files(self, recovery, temp_dir):
+        """Dotfiles in quarantine and their error logs are counted like any other file"""
+        (recovery.quarantine_folder / ".hidden.md").write_text("content")
+        (recovery.quarantine_folder / ".hidden.md.error.json").write_text(json.dumps(
+            {'timestamp': '2025-01-01T00:00:00', 'details': {'error_type': 'test_error'}}))
+
+        summary = recovery.get_quarantine_summary()
+
+        assert summary['total_quarantined'] == 1
+        assert summary['by_error_type'] == {'test_error': 1}
+
+    def test_quarantine_summary_keeps_ten_most_recent_errors(self, recovery, temp_dir):
+        """Recent errors are the newest ten, newest first"""
+        from datetime import datetime, timedelta
+
+        start = datetime(2025, 1, 1)
+        for i in range(12):
+            file_path = temp_dir / f"file_{i}.md"
+            file_path.write_text("content")
+            recovery._quarantine_file(file_path, "test reason", {'error_type': 'test_error'},
+                                      start + timedelta(minutes=i))
+
+        recent = recovery.get_quarantine_summary()['recent_errors']
+
+        assert [record['file'] for record in recent] == [f"file_{i}.md" for i in range(11, 1, -1)]
+
+    def test_quarantine_summary_reuses_unchanged_error_logs(self, recovery, sample_file):
+        """Error logs are parsed once and re-read only after they change"""
+        import os
+
+        quarantine_path = recovery._quarantine_file(sample_file, "test reason", {'error_type': 'first'})
+        error_log = quarantine_path.with_suffix(quarantine_path.suffix + '.error.json')
+
+        with patch('error_recovery._read_json', wraps=error_recovery._read_json) as read_json:
+            assert recovery.get_quarantine_summary()['by_error_type'] == {'first': 1}
+            assert recovery.get_quarantine_summary()['by_error_type'] == {'first': 1}
+            assert read_json.call_count == 1
+
+            error_info = json.loads(error_log.read_text())
+            error_info['details']['error_type'] = 'second'
+            error_log.write_text(json.dumps(error_info))
+            stat = error_log.stat()
+            os.utime(error_log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            assert recovery.get_quarantine_summary()['by_error_type'] == {'second': 1}
+            assert read_json.call_count == 2
+
+    def test_cleanup_old_files_removes_only_stale_entries(self, recovery):
+        """Cleanup removes entries older than the cutoff and keeps fresh ones"""
+        import os
+        import time
+
+        stale_file = recovery.error_folder / "old.error.json"
+        stale_file.write_text("{}")
+        stale_dir = recovery.processed_folder / "old_batch"
+        stale_dir.mkdir()
+        fresh_file = recovery.processed_folder / "fresh.md"
+        fresh_file.write_text("fresh")
+
+        ten_days_ago = time.time() - 10 * 24 * 60 * 60
+        for path in (stale_file, stale_dir):
+            os.utime(path, (ten_days_ago, ten_days_ago))
+
+        assert recovery.cleanup_old_files(days_to_keep=7) == 2
+        assert not stale_file.exists()
+        assert not stale_dir.exists()
+        assert fresh_file.exists()
+
+    def test_general_error_retries_then_succeeds(self, recovery, sample_file):
+        """Transient errors are retried and the retry folder is left clean"""
+        attempts = []
+
+        def processor(path):
+            attempts.append(path)
+            if len(attempts) == 1:
+                raise ValueError("transient")
+            return {'success': True}
+
+        with patch('error_recovery.time.sleep'):
+            result = recovery.process_with_recovery(sample_file, processor)
+
+        assert result == {'success': True}
+        assert attempts == [sample_file, sample_file]
+        assert list(recovery.retry_folder.iterdir()) == []
+        assert recovery.retry_history == {}
+
+    def test_general_error_quarantines_original_after_max_retries(self, recovery, sample_file):
+        """Persistent errors quarantine the original file with its full retry history"""
+        def processor(path):
+            raise ValueError("persistent")
+
+        with patch('error_recovery.time.sleep'):
+            result = recovery.process_with_recovery(sample_file, processor)
+
+        assert result['error'] == 'max_retries_exceeded'
+        assert result['retry_count'] == 2
+        assert not sample_file.exists()
+
+        quarantine_path = Path(result['quarantine_path'])
+        error_log = quarantine_path.with_suffix(quarantine_path.suffix + '.error.json')
+        error_info = json.loads(error_log.read_text())
+        assert [attempt['attempt'] for attempt in error_info['details']['retry_history']] == [1, 2, 3]
+        assert 'traceback' not in error_info['details']
+        traceback_file = quarantine_path.with_suffix(quarantine_path.suffix + '.error.traceback.txt')
+        assert "ValueError: persistent" in traceback_file.read_text()
+        assert recovery.get_quarantine_summary()['total_quarantined'] == 1
+
+        # The human-readable report is rendered on demand rather than written alongside
+        assert not quarantine_path.with_suffix(quarantine_path.suffix + '.error.txt').exists()
+        report = recovery.render_error_report(quarantine_path)
+        assert "Error Type: ValueError" in report
+        assert "  - Attempt 3: ValueError at" in report
+        assert "Full Traceback:" in report
+
+    def test_permission_error_retries_without_recursing(self, recovery, sample_file):
+        """Permission retries loop in place instead of re-entering process_with_recovery"""
+        attempts = []
+
+        def processor(path):
+            attempts.append(path)
+            if len(attempts) < 3:
+                raise PermissionError("locked")
+            return {'success': True}
+
+        with patch('error_recovery.time.sleep'), \
+             patch.object(recovery, 'process_with_recovery', wraps=recovery.process_with_recovery) as entry:
+            result = recovery.process_with_recovery(sample_file, processor)
+
+        assert result == {'success': True}
+        assert len(attempts) == 3
+        assert entry.call_count == 1
+
+    def test_error_handlers_resolve_through_subclasses(self, recovery):
+        """Exception subclasses dispatch to their nearest registered handler"""
+        class LockedError(PermissionError):
+            pass
+
+        assert recovery._get_error_handler(LockedError) == recovery._handle_permission_error
+        assert recovery._get_error_handler(FileNotFoundError) == recovery._handle_file_not_found
+        assert recovery._get_error_handler(ValueError) == recovery._handle_general_error
+
+    def test_retry_scheduler_replaces_sleeping(self, temp_dir, sample_file):
+        """With a retry scheduler, recoverable errors return a retry token instead of blocking"""
+        scheduled = []
+        recovery = FileProcessingRecovery(temp_dir, max_retries=2,
+                                          retry_scheduler=lambda *args: scheduled.append(args))
+
+        def processor(path):
+            raise ValueError("transient")
+
+        with patch('error_recovery.time.sleep') as sleep:
+            result = recovery.process_with_recovery(sample_file, processor)
+
+        sleep.assert_not_called()
+        assert result['error'] == 'retry_scheduled'
+        assert result['error_type'] == 'ValueError'
+        assert result['retry_count'] == 1
+        assert 'retry_at' in result
+        assert scheduled == [(sample_file, processor, 1, 1)]
+        assert sample_file.exists()
+
+    def test_move_to_processed_and_defer_for_later(self, recovery, sample_file, temp_dir):
+        """Files are renamed into the processed and retry folders"""
+        processed_path = recovery.move_to_processed(sample_file)
+
+        assert processed_path.parent == recovery.processed_folder
+        assert processed_path.read_text() == "ctx:: sample content"
+        assert not sample_file.exists()
+
+        other_file = temp_dir / "later.md"
+        other_file.write_text("later")
+        retry_path = recovery.defer_for_later(other_file)
+
+        assert retry_path.parent == recovery.retry_folder
+        assert not other_file.exists()
+
+    def test_move_falls_back_to_shutil_across_devices(self, recovery, sample_file):
+        """Cross-device renames fall back to shutil.move"""
+        import errno
+
+        with patch('error_recovery.os.replace', side_effect=OSError(errno.EXDEV, "cross-device")), \
+             patch('error_recovery.shutil.move') as move:
+            processed_path = recovery.move_to_processed(sample_file)
+
+        move.assert_called_once_with(str(sample_file), str(processed_path))
+
+    def test_file_not_found_logs_are_rate_limited(self, recovery, temp_dir):
+        """Bursts of vanished files only write a bounded number of error logs"""
+        recovery.file_not_found_log_limit = 3
+
+        def processor(path):
+            raise FileNotFoundError(str(path))
+
+        results = [
+            recovery.process_with_recovery(temp_dir / f"gone_{i}.md", processor)
+            for i in range(5)
+        ]
+
+        assert all(result['error'] == 'file_not_found' for result in results)
+        assert [result['error_log'] is not None for result in results] == [True, True, True, False, False]
+        assert len(list(recovery.error_folder.glob('*.error.json'))) == 3
+        assert recovery.get_quarantine_summary()['dropped_file_not_found_logs'] == 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
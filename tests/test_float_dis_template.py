@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test suite for FLOAT .dis template generation
+Tests frontmatter, template content and file output of FloatDisGenerator
+"""
+
+import json
+import pytest
+import yaml
+from datetime import datetime
+from unittest.mock import patch
+
+from float_dis_template_system import FloatDisGenerator, _emit_frontmatter, _json_string_array
+
+
+@pytest.fixture
+def generator():
+    """Fresh .dis generator"""
+    return FloatDisGenerator()
+
+
+@pytest.fixture
+def file_metadata():
+    """Metadata for a small markdown file"""
+    return {
+        'filename': 'notes.md',
+        'extension': '.md',
+        'size_bytes': 2048,
+        'file_type': 'Markdown file',
+        'created_at': '2025-06-09T12:00:00',
+        'modified_at': '2025-06-09T12:00:00'
+    }
+
+
+@pytest.fixture
+def chroma_metadata():
+    """Chroma storage details for two chunks"""
+    return {
+        'collection_name': 'float_dropzone',
+        'chunk_count': 2,
+        'total_chunks': 2,
+        'chunk_ids': ['notes_chunk_0', 'notes_chunk_1']
+    }
+
+
+@pytest.fixture
+def content_analysis():
+    """Analysis of content with FLOAT markers"""
+    return {
+        'summary': 'Meeting notes: planning session',
+        'word_count': 120,
+        'line_count': 12,
+        'content_type': 'Markdown document',
+        'has_ctx_markers': True,
+        'ctx_count': 3,
+        'tripartite_domain': 'framework',
+        'tripartite_confidence': 0.9,
+        'actionable_insights': [{'type': 'action_item', 'priority': 'high', 'content': 'Ship it'}],
+        'errors': []
+    }
+
+
+def split_dis(dis_content):
+    """Split a .dis file into parsed frontmatter and template body"""
+    _, frontmatter, body = dis_content.split('---\n', 2)
+    return yaml.safe_load(frontmatter), body
+
+
+@pytest.mark.unit
+class TestFloatDisGenerator:
+    """Test suite for FloatDisGenerator"""
+
+    def test_frontmatter_round_trips_through_yaml(self, generator, file_metadata, chroma_metadata, content_analysis):
+        """Generated frontmatter parses back to the frontmatter dict"""
+        now = datetime(2025, 6, 9, 12, 30)
+        expected = generator.generate_frontmatter(file_metadata, chroma_metadata, content_analysis, 'float_1', now)
+
+        with patch('float_dis_template_system.datetime') as mock_datetime:
+            mock_datetime.now.return_value = now
+            frontmatter, body = split_dis(
+                generator.generate_float_dis(file_metadata, chroma_metadata, content_analysis, 'float_1'))
+
+        assert frontmatter == expected
+        assert body.startswith('\n# 🗂️ FLOAT Dropzone Index: notes.md')
+
+    def test_single_timestamp_per_file(self, generator, file_metadata, chroma_metadata, content_analysis):
+        """All generated timestamps in one .dis file come from a single clock read"""
+        with patch('float_dis_template_system.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 6, 9, 12, 30, 15)
+            frontmatter, body = split_dis(
+                generator.generate_float_dis(file_metadata, chroma_metadata, content_analysis, 'float_1'))
+
+        assert mock_datetime.now.call_count == 1
+        assert frontmatter['generated_at'] == '2025-06-09T12:30:15'
+        assert frontmatter['timestamps']['processed_at'] == '2025-06-09T12:30:15'
+        assert frontmatter['timestamps']['ingestion_date'] == '2025-06-09'
+        assert body.count('2025-06-09 12:30:15') == 2
+
+    def test_create_float_dis_file_matches_generated_content(self, generator, file_metadata, chroma_metadata,
+                                                            content_analysis, temp_dir):
+        """The streamed file holds exactly what generate_float_dis returns"""
+        source = temp_dir / "notes.md"
+        source.write_text("ctx:: notes")
+
+        with patch('float_dis_template_system.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2025, 6, 9, 12, 30)
+            expected = generator.generate_float_dis(file_metadata, chroma_metadata, content_analysis, 'float_1')
+            dis_path = generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis,
+                                                       'float_1')
+
+        assert dis_path == temp_dir / "notes.float_dis.md"
+        fence, cache_key_line, rest = dis_path.read_text(encoding='utf-8').split('\n', 2)
+        assert cache_key_line.startswith('# dis-cache-key: ')
+        assert f"{fence}\n{rest}" == expected
+        assert expected.startswith('---\nfloat_id: float_1\n')
+
+    def test_create_float_dis_file_skips_unchanged_sources(self, generator, file_metadata, chroma_metadata,
+                                                          content_analysis, temp_dir):
+        """An up-to-date .dis file is kept unless its source or inputs change, or a rewrite is forced"""
+        import os
+
+        source = temp_dir / "notes.md"
+        source.write_text("ctx:: notes")
+        dis_path = generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis,
+                                                   'float_1')
+        original = dis_path.read_text(encoding='utf-8')
+        assert split_dis(original)[0]['float_id'] == 'float_1'
+
+        with patch.object(FloatDisGenerator, '_float_dis_parts', autospec=True,
+                          side_effect=FloatDisGenerator._float_dis_parts) as render:
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_1')
+            assert render.call_count == 0
+
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_1',
+                                            force=True)
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_2')
+            assert render.call_count == 2
+
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_2')
+            assert render.call_count == 3
+
+            # Re-analysed content or re-stored chunks regenerate the file for an unchanged source
+            content_analysis['ctx_count'] = 4
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_2')
+            chroma_metadata['chunk_ids'] = ['notes_chunk_0']
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_2')
+            generator.create_float_dis_file(source, file_metadata, chroma_metadata, content_analysis, 'float_2')
+            assert render.call_count == 5
+
+    def test_auto_tags_map_extensions(self, generator, file_metadata):
+        """File-type tags come from the extension, case-insensitively"""
+        for extension, expected in (('.JSON', 'data/json'), ('.txt', 'text/markdown'), ('.doc', 'document/word')):
+            file_metadata['extension'] = extension
+            tags = generator.generate_auto_tags(file_metadata, {})
+            assert tags[:3] == ['float/dropzone', 'auto-generated', expected]
+
+        file_metadata['extension'] = '.csv'
+        assert generator.generate_auto_tags(file_metadata, {})[2] == 'tripartite/low-confidence'
+
+    def test_auto_tags_size_buckets(self, generator, file_metadata):
+        """Size tags switch at 10KB, 100KB and 1MB"""
+        expected = {0: 'size/tiny', 10 * 1024 - 1: 'size/tiny', 10 * 1024: 'size/small',
+                    100 * 1024: 'size/medium', 1024 * 1024 - 1: 'size/medium', 1024 * 1024: 'size/large'}
+        for size_bytes, tag in expected.items():
+            file_metadata['size_bytes'] = size_bytes
+            assert generator.generate_auto_tags(file_metadata, {})[-1] == tag
+
+    def test_auto_tags_are_fresh_lists(self, generator, file_metadata, content_analysis):
+        """Memoized tags come back as a new list, so callers can extend them safely"""
+        tags = generator.generate_auto_tags(file_metadata, content_analysis)
+        tags.append('custom/tag')
+
+        assert generator.generate_auto_tags(file_metadata, content_analysis) == tags[:-1]
+        assert 'tripartite/high-confidence' in tags and 'insights/actionable' in tags
+
+    def test_format_file_size_units(self, generator):
+        """Sizes are scaled to the largest unit that keeps them under 1024"""
+        assert generator.format_file_size(0) == "0 B"
+        assert generator.format_file_size(1023) == "1023.0 B"
+        assert generator.format_file_size(1024) == "1.0 KB"
+        assert generator.format_file_size(1536 * 1024) == "1.5 MB"
+        assert generator.format_file_size(3 * 1024 ** 3) == "3.0 GB"
+        assert generator.format_file_size(2048 * 1024 ** 4) == "2048.0 TB"
+
+    def test_chunk_id_array_matches_json_dumps(self):
+        """The chunk id array is valid JSON whether or not ids need escaping"""
+        assert _json_string_array(['float_1_chunk_0', 'float_1_chunk_1']) == '["float_1_chunk_0", "float_1_chunk_1"]'
+        for chunk_ids in ([], ['quote"d', 'back\\slash'], ['café', 'tab\t'], ['a', '", "'], [1, 2]):
+            assert json.loads(_json_string_array(chunk_ids)) == chunk_ids
+
+    def test_emitted_frontmatter_preserves_ambiguous_scalars(self):
+        """Strings that look like other YAML types stay strings"""
+        frontmatter = {
+            'plain': 'data/json',
+            'keywords': ['yes', 'No', 'null', '~', 'on'],
+            'numeric_text': ['1.0', '2025-06-09', '0x1F', '12:30:00', '.inf'],
+            'punctuation': ['a: b', '#tag', '- item', '', ' padded ', 'line\nbreak', 'sep\u2028x'],
+            'numbers': [0, -3, 1.5, 1e-05, 1e20],
+            'flags': [True, False, None],
+            'nested': [{'type': 'action_item', 'tags': ['x']}, [], {}],
+            'empty': {},
+        }
+
+        assert yaml.safe_load(_emit_frontmatter(frontmatter)) == frontmatter
+
+    def test_unsupported_values_fall_back_to_yaml_dump(self, generator, file_metadata, chroma_metadata, content_analysis):
+        """Values outside the fixed schema types are still serialized"""
+        content_analysis['document_structure'] = {'sections': ('intro', 'body'), 'created': datetime(2025, 6, 9)}
+
+        frontmatter, _ = split_dis(
+            generator.generate_float_dis(file_metadata, chroma_metadata, content_analysis, 'float_1'))
+
+        assert frontmatter['document_structure'] == {'sections': ['intro', 'body'], 'created': datetime(2025, 6, 9)}
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test suite for the floatctl CLI
+Tests command loading, LF1M reuse and output formatting with a mocked LF1M
+"""
+
+import json
+import pytest
+from click.testing import CliRunner
+from unittest.mock import Mock, patch
+
+from floatctl.cli import cli
+
+
+@pytest.fixture
+def runner():
+    """Click test runner"""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_lf1m():
+    """Patch LF1M so commands run without ChromaDB; yields the class mock"""
+    with patch('floatctl.core.lf1m.LF1M') as lf1m_class:
+        yield lf1m_class
+
+
+def process_folder_output(runner, temp_dir, mock_lf1m, results, *args):
+    """Run `floatctl process` on a folder whose processing yields the given results"""
+    mock_lf1m.return_value.iter_process_folder.return_value = iter(results)
+    result = runner.invoke(cli, ['process', str(temp_dir), *args])
+    assert result.exit_code == 0, result.output
+    header, output = result.output.split('\n', 1)
+    assert header == f"Processing folder: {temp_dir.name} (recursive: False)"
+    return output
+
+
+@pytest.mark.unit
+class TestFloatctlCli:
+    """Test suite for the floatctl command group"""
+
+    def test_help_lists_lazy_query_command(self, runner):
+        """The lazily loaded query command is listed and its help loads on demand"""
+        result = runner.invoke(cli, ['--help'])
+        assert result.exit_code == 0
+        commands = result.output.split('Commands:', 1)[1].split()
+        assert 'query' in commands and 'process' in commands
+
+        result = runner.invoke(cli, ['query', '--help'])
+        assert result.exit_code == 0
+        assert '--no-cache' in result.output
+
+    @pytest.mark.parametrize('count', [0, 1, 3])
+    def test_process_json_output_is_valid_json(self, runner, temp_dir, mock_lf1m, count):
+        """Streamed --output json parses to the full result list for any number of results"""
+        results = [{'success': True, 'float_id': f"float_{i}", 'file_path': f"/tmp/file_{i}.md",
+                    'storage_result': {'collection': 'float_dropzone', 'chunk_count': i}}
+                   for i in range(count)]
+
+        output = process_folder_output(runner, temp_dir, mock_lf1m, results, '--output', 'json')
+
+        assert json.loads(output) == results
+
+    def test_process_summary_reports_failures_and_totals(self, runner, temp_dir, mock_lf1m):
+        """Summary output lists failed files and ends with the success totals"""
+        results = [
+            {'success': True, 'float_id': 'float_0'},
+            {'success': False, 'error': 'boom', 'file_path': '/tmp/broken.md'},
+            {'success': True, 'float_id': 'float_2'},
+        ]
+
+        output = process_folder_output(runner, temp_dir, mock_lf1m, results)
+
+        assert "Failed files:\n  ✗ broken.md: boom\n" in output
+        assert output.endswith("\nProcessed 2/3 files successfully\n")
+
+    def test_lf1m_reused_until_config_changes(self, runner, temp_dir, mock_lf1m):
+        """Commands sharing a context reuse one LF1M, and a different --config builds a new one"""
+        mock_lf1m.side_effect = lambda **kwargs: Mock(iter_process_folder=Mock(return_value=iter([])))
+        obj = {}
+
+        for _ in range(2):
+            assert runner.invoke(cli, ['process', str(temp_dir)], obj=obj).exit_code == 0
+        assert mock_lf1m.call_count == 1
+        first = obj['lf1m']
+
+        config_file = temp_dir / "other.json"
+        config_file.write_text("{}")
+        assert runner.invoke(cli, ['--config', str(config_file), 'process', str(temp_dir)], obj=obj).exit_code == 0
+
+        assert mock_lf1m.call_count == 2
+        mock_lf1m.assert_called_with(config_path=str(config_file))
+        assert obj['lf1m'] is not first
+
+    def test_query_uses_cache_unless_disabled(self, runner, mock_lf1m):
+        """Queries go through cached_search, and --no-cache searches directly"""
+        lf1m = mock_lf1m.return_value
+        lf1m.cached_search.return_value = []
+        lf1m.search_collections.return_value = []
+
+        result = runner.invoke(cli, ['query', 'plain words', '-c', 'a,b', '-l', '5'])
+        assert result.exit_code == 0
+        key, search = lf1m.cached_search.call_args[0]
+        assert key == ('query', 'plain words', ('a', 'b'), 5)
+        lf1m.search_collections.assert_not_called()
+        search()
+        lf1m.search_collections.assert_called_once_with('plain words', ['a', 'b'], 5)
+
+        lf1m.cached_search.reset_mock()
+        lf1m.search_collections.reset_mock()
+        result = runner.invoke(cli, ['query', 'plain words', '--no-cache'])
+        assert result.exit_code == 0
+        lf1m.cached_search.assert_not_called()
+        lf1m.search_collections.assert_called_once_with('plain words', None, 10)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test suite for FloatQL parsing
+Tests :: notation extraction, filters and collection routing of FloatQLParser
+"""
+
+import pytest
+
+from floatctl.floatql import FloatQLParser, get_parser
+
+
+@pytest.fixture
+def parser():
+    """Shared FloatQL parser"""
+    return get_parser()
+
+
+@pytest.mark.unit
+class TestFloatQLParser:
+    """Test suite for FloatQLParser"""
+
+    def test_get_parser_returns_shared_instance(self):
+        """The parser is built once and reused"""
+        assert get_parser() is get_parser()
+        assert isinstance(get_parser(), FloatQLParser)
+
+    def test_parse_splits_patterns_filters_and_text(self, parser):
+        """Patterns, filters and bridge ids are pulled out of the text terms"""
+        parsed = parser.parse("[karen::] ctx::meeting boundaries type:log a")
+
+        assert parsed['persona_patterns'] == ['karen']
+        assert parsed['float_patterns'] == ['ctx']
+        assert parsed['type_filters'] == ['log']
+        assert parsed['text_terms'] == ['meeting', 'boundaries']
+        assert parsed['metadata_filters']['persona_annotations'] == {'$in': ['karen']}
+        assert parser.parse("bridge::CB-20250611-1510-N1CK")['bridge_ids'] == ['CB-20250611-1510-N1CK']
+
+    def test_temporal_filters_resolve_dates(self, parser):
+        """Relative dates resolve to day strings and unknown values are kept as-is"""
+        from datetime import datetime
+
+        parsed = parser.parse("created:today modified:someday")
+        today = datetime.now().strftime('%Y-%m-%d')
+
+        assert parsed['temporal_filters'] == {'created': today, 'modified': 'someday'}
+        assert parsed['metadata_filters']['conversation_date'] == {'$gte': today}
+
+    def test_is_floatql_query(self, parser):
+        """:: notation and field filters mark a query as FloatQL"""
+        for query in ("ctx::", "[sysop::]", "bridge::CB-1", "created:today", "type:log", "date:2025-06-09"):
+            assert parser.is_floatql_query(query) is True
+        for query in ("redux patterns", "meeting: notes", ""):
+            assert parser.is_floatql_query(query) is False
+
+    def test_suggested_collections_route_by_pattern(self, parser):
+        """Specific patterns route to their collections, otherwise tripartite defaults"""
+        assert sorted(parser.get_suggested_collections(parser.parse("dispatch:: rfc::"))) == [
+            'float_dispatch_bay', 'float_rfc']
+        assert sorted(parser.get_suggested_collections(parser.parse("plain words"))) == [
+            'float_tripartite_v2_concept', 'float_tripartite_v2_framework', 'float_tripartite_v2_metaphor']
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Test suite for the LF1M core
+Tests folder processing and search caching of the floatctl processing engine
+"""
+
+import threading
+import time
+import pytest
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from floatctl.core.lf1m import LF1M, SEARCH_CACHE_FILE
+
+
+@pytest.fixture
+def lf1m(mock_config):
+    """LF1M on the basic pipeline, with a stub context aggregator in place of ChromaDB"""
+    components = {
+        'context': Mock(),
+        'enhanced_mode': True,
+        'summarizer': None,
+        'ollama_enabled': False,
+        'dis_generator': None
+    }
+    with patch.object(LF1M, '_initialize_components', return_value=components):
+        return LF1M(**mock_config)
+
+
+@pytest.mark.unit
+class TestLF1M:
+    """Test suite for LF1M"""
+
+    def test_parallel_folder_processing_keeps_file_order(self, lf1m, temp_dir):
+        """Files finish out of order on the pool but results come back in file order"""
+        folder = temp_dir / "batch"
+        folder.mkdir()
+        for i in range(8):
+            (folder / f"note_{i}.md").write_text(f"ctx:: note {i}")
+        file_paths = list(lf1m._iter_folder_files(folder, recursive=False))
+        # Earlier files take longer, so later ones would finish first without ordering
+        delays = {path.name: 0.002 * (len(file_paths) - i) for i, path in enumerate(file_paths)}
+
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def store(file_analysis):
+            name = file_analysis['metadata']['file_name']
+            with lock:
+                active.append(name)
+                peak.append(len(active))
+            time.sleep(delays[name])
+            with lock:
+                active.remove(name)
+            return {'success': True}
+
+        lf1m.components['context'].store_content_in_tripartite_collections.side_effect = store
+
+        results = list(lf1m.iter_process_folder(folder, recursive=False, parallel=4))
+
+        assert all(result['success'] for result in results)
+        assert [result['dis_file'] for result in results] == [
+            str(path.with_suffix('.float_dis.md')) for path in file_paths]
+        # ChromaDB storage stays serialized across worker threads
+        assert max(peak) == 1
+
+    def test_cached_search_reuses_results_until_expiry(self, lf1m, mock_config):
+        """Identical searches hit the cache file, even from a new LF1M, until the TTL runs out"""
+        calls = []
+
+        def search():
+            calls.append(1)
+            return [{'collection': 'float_dropzone', 'document': 'ctx:: note', 'distance': 0.25}]
+
+        key = ('query', 'ctx::note', ('float_dropzone',), 10)
+        with patch('floatctl.core.lf1m.time.time', return_value=1000.0):
+            first = lf1m.cached_search(key, search)
+            first[0]['document'] = 'changed by caller'
+            with patch.object(LF1M, '_initialize_components', return_value=lf1m.components):
+                second = LF1M(**mock_config).cached_search(key, search)
+
+        assert len(calls) == 1
+        assert second == [{'collection': 'float_dropzone', 'document': 'ctx:: note', 'distance': 0.25}]
+
+        with patch('floatctl.core.lf1m.time.time', return_value=1000.0 + lf1m.config.get('search_cache_ttl')):
+            lf1m.cached_search(key, search)
+        assert len(calls) == 2
+
+    def test_cached_search_invalidated_by_database_changes(self, lf1m, mock_config):
+        """A write to Chroma's database, or clearing the cache, drops cached results"""
+        calls = []
+
+        def search():
+            calls.append(1)
+            return [{'collection': 'float_dropzone', 'distance': 0.5}]
+
+        key = ('query', 'redux', (), 10)
+        lf1m.cached_search(key, search)
+        lf1m.cached_search(key, search)
+        assert len(calls) == 1
+
+        (Path(mock_config['chroma_data_path']) / 'chroma.sqlite3').write_bytes(b'changed')
+        lf1m.cached_search(key, search)
+        lf1m.cached_search(key, search)
+        assert len(calls) == 2
+
+        lf1m.clear_search_cache()
+        lf1m.cached_search(key, search)
+        assert len(calls) == 3
+
+    def test_cached_search_disabled_by_zero_ttl(self, lf1m):
+        """search_cache_ttl of 0 always runs the search and writes no cache file"""
+        lf1m.config.set('search_cache_ttl', 0)
+        calls = []
+        for _ in range(2):
+            lf1m.cached_search(('query', 'x', (), 10), lambda: calls.append(1) or [{'distance': 0.1}])
+
+        assert len(calls) == 2
+        assert not (Path(lf1m.chroma_data_path) / SEARCH_CACHE_FILE).exists()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
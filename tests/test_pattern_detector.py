@@ -432,5 +432,85 @@ class TestPatternDetectorEdgeCases:
             assert len(patterns) >= 0
 
 
+class TestEnhancedFloatPatternDetector:
+    """Tests against the real EnhancedFloatPatternDetector"""
+    
+    def setup_method(self):
+        """Set up test fixtures"""
+        from enhanced_pattern_detector import EnhancedFloatPatternDetector
+        self.detector = EnhancedFloatPatternDetector()
+    
+    def test_platform_and_persona_counts(self):
+        """Platform and persona scans report per-pattern counts"""
+        content = """
+        Built on lovable.dev and LOVABLE.APP, mirrored to github.com and github.com
+        Dumped into the thought bucket
+        [lf1m:: guards the boundary] [sysop:: review] [SYSOP:: again]
+        """
+        analysis = self.detector.extract_comprehensive_patterns(content)
+        
+        platforms = analysis['platform_integration']['platforms']
+        assert platforms['lovable_refs']['count'] == 2
+        assert platforms['github_refs']['count'] == 2
+        assert platforms['thought_buckets']['count'] == 1
+        assert platforms['v0_refs'] == {'count': 0, 'has_pattern': False}
+        assert analysis['platform_integration']['total_platform_references'] == 5
+        
+        personas = analysis['persona_analysis']['specific_personas']
+        assert personas['lf1m_notes']['count'] == 1
+        assert personas['sysop_notes']['count'] == 2
+        assert analysis['persona_analysis']['total_persona_annotations'] == 3
+        
+        # Nested annotations count both the outer and inner persona
+        for nested, outer, inner in (("[lf1m:: outer [qtb:: inner] done]", 'lf1m_notes', 'qtb_notes'),
+                                     ("[sysop:: a [karen:: b]", 'sysop_notes', 'karen_notes')):
+            personas = self.detector.extract_comprehensive_patterns(nested)['persona_analysis']['specific_personas']
+            assert personas[outer]['count'] == 1
+            assert personas[inner]['count'] == 1
+    
+    def test_high_priority_requires_signals(self):
+        """Plain prose is not high priority; signals or BBS heritage make it so"""
+        plain = self.detector.extract_comprehensive_patterns("Just some notes about lunch plans.")
+        assert not self.detector.is_high_priority_content(plain)
+        
+        bbs = self.detector.extract_comprehensive_patterns("Old school FILE_ID.DIZ description")
+        assert bbs['bbs_heritage']['file_id_diz']['count'] == 1
+        assert self.detector.is_high_priority_content(bbs)
+        
+        ctx = self.detector.extract_comprehensive_patterns("ctx:: morning planning")
+        assert self.detector.is_high_priority_content(ctx)
+    
+    def test_line_patterns_on_whitespace_heavy_content(self):
+        """Line-level :: patterns stay linear across long blank runs"""
+        content = " " * 3000 + "x\n" + "\n" * 3000 + "  - mood:: calm\n\t* progress:: halfway\n"
+        extended = self.detector.extract_comprehensive_patterns(content)['extended_float_patterns']
+        
+        assert extended['line_mood']['matches'] == ['calm']
+        assert extended['line_progress']['matches'] == ['halfway']
+        assert extended['line_generic']['count'] == 2
+
+    def test_echo_copy_on_long_whitespace_runs(self):
+        """echoCopy:: stays linear on long whitespace runs and drops a closing ::"""
+        import time
+
+        start = time.perf_counter()
+        extended = self.detector._extract_extended_float_patterns('echoCopy:: x' + ' ' * 100000 + 'x')
+        assert time.perf_counter() - start < 1.0
+        assert extended['echo_copy']['count'] == 1
+
+        extended = self.detector._extract_extended_float_patterns(
+            "echoCopy:: remember this   ::\necho echoCopy::   keep it\n")
+        assert extended['echo_copy']['matches'] == ['remember this', 'keep it']
+
+    def test_action_item_priority_from_urgency_markers(self):
+        """Action items mentioning urgency keywords are high priority"""
+        content = "TODO: fix this ASAP\nTODO: criticality review\nTODO: tidy docs\n"
+        analysis = self.detector.extract_comprehensive_patterns(content)
+        insights = self.detector.extract_actionable_insights(analysis)
+        
+        priorities = [insight['priority'] for insight in insights if insight['type'] == 'action_item']
+        assert priorities == ['high', 'high', 'medium']
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file